@@ -0,0 +1,164 @@
+import json
+import mmap
+import os
+import sys
+import time
+
+import pygame
+
+# On-disk cache of preprocessed assets: images decoded and scaled to every
+# size they are drawn at (stored as 32-bit BGRA, the layout convert_alpha()
+# gives on the usual ARGB displays) and sound effects decoded to raw PCM in
+# the mixer's format. All buffers are packed into one data file listed in
+# index.json; a cold start memory-maps that file and wraps the buffers in
+# Surfaces / Sounds instead of decoding the JPEG/MP3 sources again.
+# An entry is rebuilt when its source file's mtime or size changes.
+CACHE_VERSION = 1
+CACHE_DIR = ".asset_cache"
+
+class AssetCache:
+    def __init__(self, path, cache_dir=None):
+        self.path = path
+        self.cache_dir = cache_dir or os.path.join(path, CACHE_DIR)
+        self.index = {}
+        self.data_file = None
+        self.view = None
+        self.pending = {}
+        self.stamps = {}
+        self.sources = {}
+        self.hits = 0
+        self.misses = 0
+        self._open()
+
+    def _open(self):
+        try:
+            with open(os.path.join(self.cache_dir, "index.json")) as f:
+                index = json.load(f)
+            if index.get("version") != CACHE_VERSION:
+                return
+            with open(os.path.join(self.cache_dir, index["data"]), "rb") as f:
+                # Copy-on-write map: pages load lazily and a Surface written to
+                # never touches the file
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+        except (OSError, ValueError, KeyError):
+            return
+        self.index = index["entries"]
+        self.data_file = index["data"]
+        self.view = memoryview(mapped)
+
+    def stamp(self, filename):
+        # (mtime_ns, size) of a source file, checked once per run
+        stamp = self.stamps.get(filename)
+        if stamp is None:
+            st = os.stat(os.path.join(self.path, filename))
+            stamp = self.stamps[filename] = [st.st_mtime_ns, st.st_size]
+        return stamp
+
+    def lookup(self, key, filename):
+        entry = self.index.get(key)
+        if entry is None or self.view is None or entry["source"] != self.stamp(filename):
+            self.misses += 1
+            return None
+        self.hits += 1
+        return self.view[entry["offset"]:entry["offset"] + entry["length"]]
+
+    def store(self, key, filename, data, **info):
+        self.pending[key] = (dict(info, source=self.stamp(filename)), data)
+
+    def image(self, filename, size):
+        key = f"image:{filename}:{size[0]}x{size[1]}"
+        buf = self.lookup(key, filename)
+        if buf is not None:
+            return pygame.image.frombuffer(buf, size, "BGRA")
+        image = pygame.transform.smoothscale(self.source(filename), size)
+        self.store(key, filename, pygame.image.tobytes(image, "BGRA"))
+        return image
+
+    def source(self, filename):
+        # Decoded once per build however many sizes are made from it
+        image = self.sources.get(filename)
+        if image is None:
+            image = pygame.image.load(os.path.join(self.path, filename))
+            if has_display():
+                # Opaque sources (the JPEG-encoded .pngs) stay opaque when scaled
+                image = image.convert_alpha() if image.get_flags() & pygame.SRCALPHA else image.convert()
+            self.sources[filename] = image
+        return image
+
+    def sound(self, filename):
+        # PCM layout depends on the mixer settings, so they are part of the key
+        freq, fmt, channels = pygame.mixer.get_init()
+        key = f"sound:{filename}:{freq}:{fmt}:{channels}"
+        buf = self.lookup(key, filename)
+        if buf is not None:
+            return pygame.mixer.Sound(buffer=buf)
+        sound = pygame.mixer.Sound(os.path.join(self.path, filename))
+        self.store(key, filename, sound.get_raw())
+        return sound
+
+    def save(self):
+        # Rewrite the pack with every still-valid entry plus this run's new
+        # ones. Each pack gets a new file name so maps held by running games
+        # (or this one) stay valid.
+        if not self.pending:
+            return False
+        os.makedirs(self.cache_dir, exist_ok=True)
+        chunks = []
+        for key, entry in self.index.items():
+            if key in self.pending or self.view is None:
+                continue
+            filename = key.split(":")[1]
+            if os.path.exists(os.path.join(self.path, filename)) and entry["source"] == self.stamp(filename):
+                chunks.append((key, entry, self.view[entry["offset"]:entry["offset"] + entry["length"]]))
+        chunks += [(key, entry, data) for key, (entry, data) in self.pending.items()]
+        data_file = f"data-{time.time_ns()}.bin"
+        entries = {}
+        offset = 0
+        with open(os.path.join(self.cache_dir, data_file), "wb") as f:
+            for key, entry, data in chunks:
+                f.write(data)
+                entries[key] = dict(entry, offset=offset, length=len(data))
+                offset += len(data)
+        tmp = os.path.join(self.cache_dir, "index.json.tmp")
+        with open(tmp, "w") as f:
+            json.dump({"version": CACHE_VERSION, "data": data_file, "entries": entries}, f, indent=1)
+        os.replace(tmp, os.path.join(self.cache_dir, "index.json"))
+        # Old packs may still be mapped (always on Windows); leave those
+        for name in os.listdir(self.cache_dir):
+            if name.startswith("data-") and name not in (data_file, self.data_file):
+                try:
+                    os.remove(os.path.join(self.cache_dir, name))
+                except OSError:
+                    pass
+        self.pending.clear()
+        self.sources.clear()
+        return True
+
+def has_display():
+    return pygame.display.get_init() and pygame.display.get_surface() is not None
+
+# Build step: python asset_cache.py fills the cache for every asset and size
+# game16 uses, so the first real launch only maps it
+def main():
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    import game16
+    game16.init_display(headless=True)
+    cache = AssetCache(game16.ASSET_PATH)
+    start = time.perf_counter()
+    for filename, sizes in game16.IMAGE_SIZES.items():
+        for size in sizes:
+            cache.image(filename, size)
+    try:
+        pygame.mixer.init()
+    except pygame.error as e:
+        print(f"no audio device, sounds not cached: {e}")
+    else:
+        for filename in game16.SOUND_FILES:
+            cache.sound(filename)
+    built = len(cache.pending)
+    cache.save()
+    print(f"{built} entries built, {cache.hits} already cached, in {time.perf_counter() - start:.3f}s -> {cache.cache_dir}")
+    sys.exit()
+
+if __name__ == "__main__":
+    main()
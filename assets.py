@@ -0,0 +1,73 @@
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pygame
+
+# Background asset loader. Jobs run in submission order on one worker thread
+# so the first frame never waits on decoding; callers poll get(name), which
+# hands back a placeholder until the asset is ready (or if it failed).
+# With an AssetCache, sounds and scaled images come from its mapped buffers
+# and only the worker thread ever touches the cache.
+class AssetLoader:
+    def __init__(self, path, cache=None):
+        self.path = path
+        self.cache = cache
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="assets")
+        self.futures = {}
+        self.finished = {}
+        self.lock = threading.Lock()
+        self.started = time.perf_counter()
+
+    def submit(self, name, fn, *args):
+        future = self.executor.submit(fn, *args)
+        self.futures[name] = future
+        future.add_done_callback(lambda f: self._finish(name))
+        return future
+
+    def _finish(self, name):
+        with self.lock:
+            self.finished[name] = time.perf_counter()
+
+    def sound(self, name, filename):
+        if self.cache is not None:
+            return self.submit(name, self.cache.sound, filename)
+        return self.submit(name, lambda: pygame.mixer.Sound(os.path.join(self.path, filename)))
+
+    def image(self, name, filename, size=None):
+        # Decoded (and scaled) off the main thread; convert() is left to the
+        # caller since it needs the display
+        def load():
+            if self.cache is not None and size:
+                return self.cache.image(filename, size)
+            image = pygame.image.load(os.path.join(self.path, filename))
+            return pygame.transform.smoothscale(image, size) if size else image
+        return self.submit(name, load)
+
+    def ready(self, name):
+        future = self.futures.get(name)
+        return future is not None and future.done()
+
+    def get(self, name, placeholder=None):
+        future = self.futures.get(name)
+        if future is None or not future.done() or future.exception() is not None:
+            return placeholder
+        return future.result()
+
+    def progress(self):
+        # (finished jobs, total jobs)
+        return sum(f.done() for f in self.futures.values()), len(self.futures)
+
+    def done(self):
+        return all(f.done() for f in self.futures.values())
+
+    def ready_ms(self):
+        # Time from construction until the last job finished, None while loading
+        with self.lock:
+            if not self.futures or len(self.finished) < len(self.futures):
+                return None
+            return (max(self.finished.values()) - self.started) * 1000
+
+    def shutdown(self):
+        self.executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,79 @@
+import time
+
+import pygame
+
+# Sound effect dispatcher. The game requests effects by name during update();
+# requests are coalesced per name and played once per frame by flush(), on a
+# reserved pool of mixer channels. An effect repeated within `window` seconds
+# of its last start is dropped, and when every channel is busy the lowest
+# priority (then oldest) voice is stolen, provided it is not above the new one.
+class AudioManager:
+    def __init__(self, lookup, priorities, channels=6, window=0.05):
+        self.lookup = lookup
+        self.priorities = priorities
+        self.channel_count = channels
+        self.window = window
+        self.pending = {}
+        self.channels = None
+        self.voices = []
+        self.last_started = {}
+        self.played = 0
+        self.coalesced = 0
+        self.stolen = 0
+        self.dropped = 0
+
+    def request(self, name):
+        # Cheap enough for the collision loop: one dict update, bounded by
+        # the number of effect names
+        self.pending[name] = self.pending.get(name, 0) + 1
+
+    def setup(self):
+        # Mixer comes up on the asset thread, so channels are claimed lazily
+        if self.channels is None and pygame.mixer.get_init():
+            if pygame.mixer.get_num_channels() < self.channel_count:
+                pygame.mixer.set_num_channels(self.channel_count)
+            # Reserved channels are never picked by a bare Sound.play()
+            pygame.mixer.set_reserved(self.channel_count)
+            self.channels = [pygame.mixer.Channel(i) for i in range(self.channel_count)]
+            self.voices = [(0, float("-inf"), None)] * self.channel_count
+        return self.channels is not None
+
+    def flush(self, now=None):
+        if not self.pending:
+            return
+        pending = self.pending
+        self.pending = {}
+        if not self.setup():
+            return
+        now = time.perf_counter() if now is None else now
+        for name in sorted(pending, key=lambda n: -self.priorities.get(n, 0)):
+            self.coalesced += pending[name] - 1
+            if now - self.last_started.get(name, -self.window) < self.window:
+                self.coalesced += 1
+                continue
+            sound = self.lookup(name)
+            if sound is None:
+                continue
+            index = self.pick_channel(self.priorities.get(name, 0))
+            if index is None:
+                self.dropped += 1
+                continue
+            self.channels[index].play(sound)
+            self.voices[index] = (self.priorities.get(name, 0), now, name)
+            self.last_started[name] = now
+            self.played += 1
+
+    def pick_channel(self, priority):
+        victim = None
+        for index, channel in enumerate(self.channels):
+            if not channel.get_busy():
+                return index
+            if victim is None or self.voices[index][:2] < self.voices[victim][:2]:
+                victim = index
+        if self.voices[victim][0] > priority:
+            return None
+        self.stolen += 1
+        return victim
+
+    def clear(self):
+        self.pending.clear()
@@ -0,0 +1,90 @@
+import os
+import random
+import sys
+import tracemalloc
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+from game16 import HEIGHT, MASK_KEYS, Game
+
+# Allocation check for the sim tick: after a warm-up, Game.update() should
+# leave nothing behind (entities, rects, pool slots and grid cells are all
+# reused) and its short-lived temporaries must not grow with the number of
+# obstacles. Exits with an error if either fails, like bench_variants.py.
+# Usage: python bench_alloc.py [obstacles,...] [frames]
+
+# Mean temporaries allowed per tick (iterators, query lists, key tuples),
+# a little above the 220-370 B measured; a temporary freed at once barely
+# moves the peak, so reused objects are also checked directly (reused_rects)
+MAX_TRANSIENT = 512
+# Net bytes allowed over the measured ticks: cell tables and the floats
+# held by moving entities change size a little from tick to tick
+MAX_RETAINED = 16384
+
+# Ticks before measuring (two minutes of play): long enough for the
+# obstacles to have crossed every grid cell they can reach
+WARM_UP = 7200
+
+def make_game(count, seed):
+    game = Game(headless=True, seed=seed, max_obstacles=count)
+    game.show_level_intro = False
+    rng = random.Random(seed)
+    while len(game.obstacles) < count:
+        game.spawn_obstacle("rock" if len(game.obstacles) % 4 else "blackhole")
+        # Spawned rocks start above the screen; put them in play
+        obs = game.obstacles[-1]
+        obs.y = rng.randint(0, HEIGHT - obs.size)
+        game.obstacle_grid.move(obs)
+    return game
+
+def reused_rects(game):
+    # get_rect() hands back each entity's own Rect, not a new one per call
+    entities = [game.player] + game.obstacles[:1] + game.stars[:1]
+    return all(e.get_rect() is e.get_rect() for e in entities)
+
+def step(game, keys):
+    game.update(keys)
+    # Stay in play: no game over, riddle or level change during the run
+    game.player.crashes = 0
+    game.game_over = game.awaiting_riddle = False
+    game.score = 0
+
+def measure(count, frames, seed=1):
+    game = make_game(count, seed)
+    rng = random.Random(seed)
+    keys = [MASK_KEYS[rng.randrange(len(MASK_KEYS))] for _ in range(256)]
+    # Trace the warm-up too: freeing a block allocated before tracing
+    # started is not counted, so every float replaced would look like growth
+    tracemalloc.start()
+    for frame in range(WARM_UP):
+        step(game, keys[frame % len(keys)])
+    start, _ = tracemalloc.get_traced_memory()
+    # Running totals only: a list of samples would show up as retained memory
+    total = worst = 0
+    for frame in range(frames):
+        before, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        step(game, keys[frame % len(keys)])
+        peak = tracemalloc.get_traced_memory()[1] - before
+        total += peak
+        worst = max(worst, peak)
+    retained = tracemalloc.get_traced_memory()[0] - start
+    tracemalloc.stop()
+    return total / frames, worst, retained, reused_rects(game)
+
+def main():
+    counts = [int(c) for c in sys.argv[1].split(",")] if len(sys.argv) > 1 else [10, 200, 1000]
+    frames = int(sys.argv[2]) if len(sys.argv) > 2 else 1200
+    failed = False
+    for count in counts:
+        mean, worst, retained, reused = measure(count, frames)
+        ok = mean <= MAX_TRANSIENT and retained <= MAX_RETAINED and reused
+        failed |= not ok
+        print(f"{count:5} obstacles: temporaries per tick {mean:7.1f} B mean, {worst:6} B worst;"
+              f" {retained:6} B retained after {frames} ticks; rects {'reused' if reused else 'NEW PER CALL'}"
+              f"  {'ok' if ok else 'FAIL'}")
+    sys.exit(1 if failed else 0)
+
+if __name__ == "__main__":
+    main()
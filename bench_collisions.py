@@ -0,0 +1,73 @@
+import random
+import sys
+import time
+
+from game16 import HEIGHT, WIDTH, Obstacle, UFO
+from spatial import SpatialHash
+
+# Benchmark: linear player/obstacle scan vs the SpatialHash broadphase.
+# Usage: python bench_collisions.py [obstacles] [frames]
+
+def make_world(count, seed):
+    random.seed(seed)
+    player = UFO()
+    player.x, player.y = WIDTH // 2, HEIGHT // 2
+    obstacles = []
+    for i in range(count):
+        obs = Obstacle("rock" if i % 4 else "blackhole")
+        # Spawned rocks start above the screen; put them in view so they can collide
+        obs.y = random.randint(0, HEIGHT - obs.size)
+        obstacles.append(obs)
+    return player, obstacles
+
+def steer(player, frame):
+    player.x = WIDTH // 2 + int(300 * ((frame % 120) / 60 - 1))
+    player.y = HEIGHT // 2 + int(200 * ((frame % 90) / 45 - 1))
+
+def run_linear(count, frames, seed):
+    player, obstacles = make_world(count, seed)
+    hits = 0
+    start = time.perf_counter()
+    for frame in range(frames):
+        steer(player, frame)
+        for obs in obstacles:
+            obs.update()
+            if player.get_rect().colliderect(obs.get_rect()) and not obs.already_hit:
+                obs.already_hit = True
+                hits += 1
+    return (time.perf_counter() - start) * 1000 / frames, hits
+
+def run_grid(count, frames, seed):
+    player, obstacles = make_world(count, seed)
+    grid = SpatialHash()
+    for obs in obstacles:
+        grid.insert(obs, obs.size)
+    hits = 0
+    start = time.perf_counter()
+    for frame in range(frames):
+        steer(player, frame)
+        for obs in obstacles:
+            obs.update()
+        grid.refresh(obstacles)
+        player_rect = player.get_rect()
+        for obs in grid.query(*player_rect):
+            if not obs.already_hit and player_rect.colliderect(obs.get_rect()):
+                obs.already_hit = True
+                hits += 1
+    return (time.perf_counter() - start) * 1000 / frames, hits
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    frames = int(sys.argv[2]) if len(sys.argv) > 2 else 120
+    linear_ms, linear_hits = run_linear(count, frames, seed=1)
+    grid_ms, grid_hits = run_grid(count, frames, seed=1)
+    print(f"{count} obstacles, {frames} frames")
+    print(f"linear scan : {linear_ms:7.3f} ms/frame  hits={linear_hits}")
+    print(f"spatial hash: {grid_ms:7.3f} ms/frame  hits={grid_hits}")
+    print(f"speedup     : {linear_ms / grid_ms:.2f}x  (60 FPS budget {1000 / 60:.2f} ms)")
+    if linear_hits != grid_hits:
+        print("MISMATCH: broadphase changed collision results")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+import random
+import sys
+import time
+
+import numpy as np
+
+from game16 import HEIGHT, WIDTH, Game, KeyState, Obstacle, UFO, pygame
+from obstacle_array import ObstacleArray
+
+# Checks the NumPy obstacle engine against the per-object rules, then times both.
+# Usage: python bench_obstacle_array.py [obstacles] [frames]
+
+MOVES = [pygame.K_LEFT, pygame.K_RIGHT, pygame.K_UP, pygame.K_DOWN]
+
+def pilot(frame):
+    return KeyState([MOVES[(frame // 30) % 4], MOVES[(frame // 45) % 4]])
+
+def check_game_equivalence(frames=5000, seed=7):
+    results = []
+    for vectorized in (False, True):
+        random.seed(seed)
+        game = Game(headless=True, vectorized=vectorized)
+        for frame in range(frames):
+            game.update(pilot(frame))
+            if game.game_over or game.awaiting_riddle:
+                game.game_over = game.awaiting_riddle = False
+                game.player.crashes = 0
+        if vectorized:
+            arr = game.obstacle_array
+            state = list(zip(arr.x.tolist(), arr.y.tolist(), arr.dx.tolist(), arr.angle.tolist()))
+        else:
+            state = [(float(o.x), float(o.y), float(o.dx), o.angle) for o in game.obstacles]
+        results.append((game.score, game.player.crashes, state))
+    return results[0] == results[1]
+
+def make_obstacles(count, seed):
+    random.seed(seed)
+    obstacles = []
+    for i in range(count):
+        obs = Obstacle("rock" if i % 4 else "blackhole")
+        obs.y = random.randint(0, HEIGHT - obs.size)
+        obstacles.append(obs)
+    return obstacles
+
+def time_objects(count, frames, player_rect):
+    obstacles = make_obstacles(count, seed=1)
+    random.seed(2)
+    hits = 0
+    start = time.perf_counter()
+    for _ in range(frames):
+        for obs in obstacles:
+            obs.update()
+            if player_rect.colliderect(obs.get_rect()) and not obs.already_hit:
+                obs.already_hit = True
+                hits += 1
+    return (time.perf_counter() - start) * 1000 / frames, hits, obstacles
+
+def time_arrays(count, frames, player_rect):
+    arr = ObstacleArray(WIDTH, HEIGHT, count)
+    for obs in make_obstacles(count, seed=1):
+        arr.append(obs)
+    random.seed(2)
+    hits = 0
+    start = time.perf_counter()
+    for _ in range(frames):
+        arr.update()
+        hits += len(arr.collide(player_rect))
+    return (time.perf_counter() - start) * 1000 / frames, hits, arr
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    frames = int(sys.argv[2]) if len(sys.argv) > 2 else 100
+    same = check_game_equivalence()
+    print(f"game state matches per-object engine: {same}")
+    player = UFO()
+    player.x, player.y = WIDTH // 2, HEIGHT // 2
+    player_rect = player.get_rect()
+    obj_ms, obj_hits, obstacles = time_objects(count, frames, player_rect)
+    arr_ms, arr_hits, arr = time_arrays(count, frames, player_rect)
+    same_pos = np.array_equal(arr.x, [o.x for o in obstacles]) and np.array_equal(arr.y, [o.y for o in obstacles])
+    print(f"{count} obstacles, {frames} frames")
+    print(f"per-object : {obj_ms:8.3f} ms/frame  hits={obj_hits}")
+    print(f"numpy SoA  : {arr_ms:8.3f} ms/frame  hits={arr_hits}  positions match={same_pos}")
+    print(f"speedup    : {obj_ms / arr_ms:.1f}x")
+    if not (same and same_pos and obj_hits == arr_hits):
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
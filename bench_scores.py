@@ -0,0 +1,59 @@
+import os
+import random
+import sys
+import tempfile
+import time
+
+from score_store import ScoreStore
+
+# Score store check: what recording costs the game loop, how fast the
+# writer thread keeps up, and how long a leaderboard takes to come back
+# from a store holding many runs.
+# Usage: python bench_scores.py [sessions]
+
+LEVELS = 3
+
+def percentile(values, p):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(p * len(values)))]
+
+def main():
+    sessions = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    rng = random.Random(1)
+    with tempfile.TemporaryDirectory() as tmp:
+        store = ScoreStore(os.path.join(tmp, "scores.db"))
+        # A run as the game records one: crashes and riddle answers per level
+        calls = []
+        start = time.perf_counter()
+        for s in range(sessions):
+            t = time.perf_counter()
+            session = store.start_session("game16", s)
+            total = 0
+            for level in range(LEVELS):
+                for _ in range(rng.randint(0, 2)):
+                    store.record_crash(session, level, rng.randint(0, 9999), "obstacle")
+                store.record_riddle(session, level, "What has keys but can't open locks?", "piano", True)
+                score = rng.randint(100, 200)
+                total += score
+                store.record_level(session, "game16", level, "Pink City", score, 1, 30.0, total)
+            store.end_session(session, True)
+            calls.append((time.perf_counter() - t) * 1e6)
+        queued = time.perf_counter() - start
+        # The first query waits for every row queued before it
+        store.top_sessions("game16").result()
+        written = time.perf_counter() - start
+        waits = []
+        for _ in range(200):
+            t = time.perf_counter()
+            best = store.top_sessions("game16", 5).result()
+            waits.append((time.perf_counter() - t) * 1000)
+        level_best = store.top_level("game16", 0, 5).result()
+        store.close()
+    print(f"{sessions} runs: {sessions / queued:.0f} runs/s queued by the game thread, "
+          f"{sessions / written:.0f} runs/s committed by the writer")
+    print(f"game thread per run ({LEVELS} levels): p50 {percentile(calls, 0.5):.1f} us  p99 {percentile(calls, 0.99):.1f} us")
+    print(f"leaderboard (top 5 of {sessions}): p50 {percentile(waits, 0.5):.3f} ms  p99 {percentile(waits, 0.99):.3f} ms")
+    print(f"best run {best[0][1]} Energy, best level 1 score {level_best[0][1]}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+import os
+import random
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import game16
+from game16 import HEIGHT, NO_KEYS, WIDTH, Game, pygame
+
+# Times the play-screen draw with primitive sprites (full redraw and the
+# --dirty presenter) against the LayeredDirty sprite group with the photo
+# textures, and counts the pixels each one hands to the display.
+# Usage: python bench_sprites.py [obstacles,...] [frames]
+
+pushed = [0]
+
+def count_flip():
+    pushed[0] += WIDTH * HEIGHT
+
+def count_update(rects=None):
+    if rects is None:
+        count_flip()
+    else:
+        pushed[0] += sum(pygame.Rect(r).clip(0, 0, WIDTH, HEIGHT).width * pygame.Rect(r).clip(0, 0, WIDTH, HEIGHT).height
+                         for r in rects)
+
+def make_game(count, mode):
+    random.seed(1)
+    game = Game(seed=1, max_obstacles=count, dirty_rects=mode == "dirty", sprites=mode == "sprites")
+    game.show_level_intro = False
+    # Replace the level's off-screen spawns with on-screen ones
+    game.obstacle_pool.recycle_all()
+    game.obstacle_grid.clear()
+    while len(game.obstacles) < count:
+        game.spawn_obstacle("rock" if len(game.obstacles) % 4 else "blackhole")
+        obs = game.obstacles[-1]
+        obs.y = random.randint(0, HEIGHT - obs.size)
+    return game
+
+def time_draw(count, frames, mode):
+    game = make_game(count, mode)
+    # Warm-up: sprite caches and the first full-screen frame
+    for _ in range(10):
+        game.update(NO_KEYS)
+        game.draw(game16.screen)
+    pushed[0] = 0
+    total = 0.0
+    for _ in range(frames):
+        game.player.crashes = 0
+        game.update(NO_KEYS)
+        game.awaiting_riddle = game.game_over = False
+        start = time.perf_counter()
+        game.draw(game16.screen)
+        total += time.perf_counter() - start
+    return total * 1000 / frames, pushed[0] / frames
+
+def main():
+    counts = [int(c) for c in sys.argv[1].split(",")] if len(sys.argv) > 1 else [10, 50, 200]
+    frames = int(sys.argv[2]) if len(sys.argv) > 2 else 300
+    game16.init_display(headless=True)
+    assets = game16.start_assets(textures=True)
+    while not assets.done():
+        time.sleep(0.01)
+    pygame.display.flip = count_flip
+    pygame.display.update = count_update
+    print(f"{frames} frames per run, draw() only (update() excluded)")
+    for count in counts:
+        for mode in ("primitive", "dirty", "sprites"):
+            ms, pixels = time_draw(count, frames, mode)
+            print(f"{count:5} obstacles  {mode:9}: {ms:7.3f} ms/frame  {pixels / (WIDTH * HEIGHT) * 100:6.1f}% of screen pushed")
+    assets.shutdown()
+
+if __name__ == "__main__":
+    main()
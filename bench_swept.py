@@ -0,0 +1,90 @@
+import os
+import random
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+from game16 import MASK_KEYS, NO_KEYS, SIM_HZ, Game, KeyState, Obstacle, pygame
+
+# Swept collisions: a rock in the UFO's path is hit however far one step
+# moves it, and playing several ticks per update() leaves the outcomes of
+# whole games where one tick per update() puts them. The pilot holds random
+# keys for HOLD ticks regardless of the game, so every step length plays
+# the same inputs.
+# Usage: python bench_swept.py [games] [seconds per game] [engine: objects|arrays]
+
+STEPS = (1, 2, 4, 8)
+HOLD = 24
+
+def tunnel_check(vectorized):
+    # One rock between the UFO and where a 30-tick step ends (150 px on):
+    # the end position is past it, only the sweep sees the hit
+    game = Game(headless=True, seed=1, vectorized=vectorized)
+    while game.show_level_intro:
+        game.update(NO_KEYS)
+    game.ruleset = dict(game.ruleset, spawn_chance=0)
+    game.obstacle_pool.recycle_all()
+    game.obstacle_grid.clear()
+    if game.obstacle_array is not None:
+        game.obstacle_array.clear()
+    game.player.x, game.player.y = 200, 300
+    rock = Obstacle("rock", random.Random(1))
+    rock.x, rock.y, rock.dx, rock.dy = 250, 290, 0, 0
+    if game.obstacle_array is not None:
+        game.obstacle_array.append(rock)
+    else:
+        spawned = game.obstacle_pool.spawn("rock", random.Random(1))
+        spawned.x, spawned.y, spawned.dx, spawned.dy = rock.x, rock.y, 0, 0
+        game.obstacle_grid.insert(spawned, spawned.size)
+    crashes = game.player.crashes
+    game.update(KeyState([pygame.K_RIGHT]), 30)
+    end = game.player.get_rect()
+    discrete = end.colliderect(pygame.Rect(int(rock.x), int(rock.y), rock.size, rock.size))
+    return game.player.crashes - crashes, discrete
+
+def play(seed, ticks_per_step, max_ticks, vectorized):
+    game = Game(headless=True, seed=seed, vectorized=vectorized)
+    rng = random.Random(seed)
+    masks = []
+    stars = levels = 0
+    start = time.perf_counter()
+    while game.tick < max_ticks and not game.game_over:
+        score, level = game.score, game.level_index
+        if game.awaiting_riddle:
+            game.perform("answer", game.current_riddle["answer"])
+        block = game.tick // HOLD
+        while len(masks) <= block:
+            masks.append(rng.randrange(len(MASK_KEYS)))
+        game.update(MASK_KEYS[masks[block]], ticks_per_step)
+        stars += max(0, game.score - score) // 10
+        levels += game.level_index != level
+        if game.show_scoreboard or game.show_win:
+            break
+    return stars, levels, game.player.crashes, game.tick, time.perf_counter() - start
+
+def main():
+    games = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    seconds = int(sys.argv[2]) if len(sys.argv) > 2 else 60
+    vectorized = len(sys.argv) > 3 and sys.argv[3] == "arrays"
+    hits, discrete = tunnel_check(vectorized)
+    print(f"rock crossed in one 30-tick step: swept hits={hits}  end-position check hits={int(discrete)}")
+    print(f"{games} games x {seconds}s, random held keys, {'arrays' if vectorized else 'objects'} engine")
+    print(f"{'ticks/step':>10} {'stars/min':>9} {'crashes/min':>11} {'levels':>6} {'game over':>9} {'sim ticks/s':>11}")
+    failed = hits != 1
+    for ticks in STEPS:
+        results = [play(seed, ticks, seconds * SIM_HZ, vectorized) for seed in range(games)]
+        minutes = sum(r[3] for r in results) / SIM_HZ / 60
+        stars = sum(r[0] for r in results) / minutes
+        crashes = sum(r[2] for r in results) / minutes
+        levels = sum(r[1] for r in results)
+        over = sum(r[2] >= 5 for r in results)
+        rate = sum(r[3] for r in results) / sum(r[4] for r in results)
+        print(f"{ticks:10} {stars:9.1f} {crashes:11.2f} {levels:6} {over:9} {rate:11.0f}")
+    if failed:
+        print("FAIL: the swept test missed a rock the UFO passed through")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,185 @@
+import json
+import os
+import random
+import resource
+import subprocess
+import sys
+import time
+
+# Benchmark suite: scripted scenarios against each variant's Game class.
+# Every (variant, scenario) runs in its own process under SDL's dummy video
+# and audio drivers, so module-level setup and peak RSS are measured per run.
+#
+#   python bench_variants.py                  run everything, compare with baselines
+#   python bench_variants.py --quick          1/60 of the frames (smoke run)
+#   python bench_variants.py --save-baseline  store the results as the new baselines
+#   python bench_variants.py --only game16    restrict to some variants/scenarios
+#   python bench_variants.py --threshold 1.5  allowed slowdown vs baseline (default 1.25)
+
+VARIANTS = ["game9", "game10", "game12", "game13", "game16"]
+SCENARIOS = {
+    # name: (frames, draw every n-th frame)
+    "level3_1000": (600, 1),
+    "hour_session": (60 * 60 * 60, 60),
+    "riddle_overlay": (600, 1),
+}
+BASELINE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "bench_baselines.json")
+# Metrics checked against the baseline; memory is reported but machine-dependent
+CHECKED = ("update_ms", "draw_ms")
+# Slack added to the allowed time: a few microseconds of timer noise would
+# otherwise be a 25% slowdown on the cheapest metrics
+SLACK_MS = 0.05
+
+# Flags that hold a variant in an intro, riddle or end screen instead of play
+SCREEN_FLAGS = ("showing_level_name", "level_transition", "show_level_intro",
+                "level_complete", "awaiting_riddle", "game_over")
+
+def keep_playing(game):
+    for flag in SCREEN_FLAGS:
+        if hasattr(game, flag):
+            setattr(game, flag, False)
+    game.player.crashes = 0
+    game.score = 0
+
+def add_obstacle(module, game, kind, rng):
+    if hasattr(game, "spawn_obstacle"):
+        # game16: go through its pool/grid, lifting the cap for the stress level
+        game.max_obstacles = game.obstacle_pool.cap = max(game.obstacle_pool.cap, len(game.obstacles) + 1)
+        game.spawn_obstacle(kind)
+        obs = game.obstacles[-1]
+    else:
+        obs = module.Obstacle(kind)
+        game.obstacles.append(obs)
+    # Spawned rocks start above the screen; put them in play
+    obs.y = rng.randint(0, module.HEIGHT - obs.size)
+
+def setup(module, game, scenario):
+    if scenario == "level3_1000":
+        game.level_index = 2
+        game.reset_level()
+        rng = random.Random(1)
+        while len(game.obstacles) < 1000:
+            add_obstacle(module, game, "rock" if len(game.obstacles) % 4 else "blackhole", rng)
+        keep_playing(game)
+    elif scenario == "hour_session":
+        if hasattr(game, "reset_level"):
+            game.reset_level()
+        keep_playing(game)
+    elif scenario == "riddle_overlay":
+        game.reset_level()
+        keep_playing(game)
+        game.awaiting_riddle = True
+        game.current_riddle = (game.riddles if hasattr(game, "riddles") else module.riddles)[0]
+        game.riddle_answer = "abc"
+
+def percentile(values, p):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(p * len(values)))] if values else 0.0
+
+def run_worker(variant, scenario, scale):
+    os.environ["SDL_VIDEODRIVER"] = "dummy"
+    os.environ["SDL_AUDIODRIVER"] = "dummy"
+    random.seed(0)
+    start = time.perf_counter()
+    module = __import__(variant)
+    # Variants are rulesets for the game16 engine; older checkouts had a full copy each
+    ruleset = getattr(module, "RULESET", None)
+    if ruleset is not None:
+        import game16 as module
+    if hasattr(module, "init_display"):
+        module.init_display(headless=True)
+    import_ms = (time.perf_counter() - start) * 1000
+    game = module.Game(ruleset=ruleset) if ruleset is not None else module.Game()
+    setup(module, game, scenario)
+    frames, draw_every = SCENARIOS[scenario]
+    frames = max(1, frames // scale)
+    keep = scenario != "riddle_overlay"
+    # First draw builds cached backgrounds/sprites; report it on its own
+    t = time.perf_counter()
+    game.draw(module.screen)
+    first_draw_ms = (time.perf_counter() - t) * 1000
+    update_times, draw_times = [], []
+    peak_entities = 0
+    for frame in range(frames):
+        if keep:
+            keep_playing(game)
+        t = time.perf_counter()
+        game.update()
+        update_times.append((time.perf_counter() - t) * 1000)
+        if frame % draw_every == 0:
+            t = time.perf_counter()
+            game.draw(module.screen)
+            draw_times.append((time.perf_counter() - t) * 1000)
+        peak_entities = max(peak_entities, len(game.obstacles) + len(game.stars))
+    return {
+        "frames": frames,
+        "import_ms": import_ms,
+        "first_draw_ms": first_draw_ms,
+        "update_ms": sum(update_times) / len(update_times),
+        "update_p95_ms": percentile(update_times, 0.95),
+        "draw_ms": sum(draw_times) / len(draw_times),
+        "draw_p95_ms": percentile(draw_times, 0.95),
+        "peak_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+        "obstacles": len(game.obstacles),
+        "stars": len(game.stars),
+        "peak_entities": peak_entities,
+    }
+
+def run_all(selected, scale):
+    results = {}
+    for variant in VARIANTS:
+        for scenario in SCENARIOS:
+            if selected and variant not in selected and scenario not in selected:
+                continue
+            out = subprocess.run([sys.executable, os.path.abspath(__file__), "--worker", variant, scenario, str(scale)],
+                                 capture_output=True, text=True)
+            if out.returncode != 0:
+                print(f"{variant:7} {scenario:15} FAILED\n{out.stderr.strip()}")
+                continue
+            result = json.loads(out.stdout.strip().splitlines()[-1])
+            results[f"{variant}/{scenario}"] = result
+            print(f"{variant:7} {scenario:15} update {result['update_ms']:8.3f} ms (p95 {result['update_p95_ms']:7.3f})"
+                  f"  draw {result['draw_ms']:8.3f} ms (p95 {result['draw_p95_ms']:7.3f})"
+                  f"  rss {result['peak_rss_mb']:6.1f} MB  entities {result['peak_entities']}")
+    return results
+
+def compare(results, baselines, threshold):
+    regressions = []
+    for key, result in results.items():
+        base = baselines.get(key)
+        if base is None:
+            continue
+        for metric in CHECKED:
+            if result[metric] > base[metric] * threshold + SLACK_MS:
+                regressions.append(f"{key} {metric}: {result[metric]:.3f} ms vs baseline {base[metric]:.3f} ms")
+    return regressions
+
+def main():
+    args = sys.argv[1:]
+    if args and args[0] == "--worker":
+        print(json.dumps(run_worker(args[1], args[2], int(args[3]))))
+        return
+    scale = 60 if "--quick" in args else 1
+    threshold = float(args[args.index("--threshold") + 1]) if "--threshold" in args else 1.25
+    selected = set(args[args.index("--only") + 1].split(",")) if "--only" in args else set()
+    results = run_all(selected, scale)
+    if "--save-baseline" in args:
+        baselines = {}
+        if os.path.exists(BASELINE_FILE):
+            with open(BASELINE_FILE) as f:
+                baselines = json.load(f)
+        baselines.update(results)
+        with open(BASELINE_FILE, "w") as f:
+            json.dump(baselines, f, indent=1, sort_keys=True)
+        print(f"baselines saved to {BASELINE_FILE}")
+        return
+    if scale != 1 or not os.path.exists(BASELINE_FILE):
+        return
+    with open(BASELINE_FILE) as f:
+        regressions = compare(results, json.load(f), threshold)
+    for line in regressions:
+        print("REGRESSION", line)
+    sys.exit(1 if regressions else 0)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+import os
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import numpy as np
+
+from vec_env import NUM_ACTIONS, ProcessVecEnv, VecEnv
+
+# Env-steps per second of the batched environments under a random pilot:
+# all games in this process, then split over a process pool.
+# Usage: python bench_vec_env.py [envs] [steps] [workers]
+
+def run(env, steps, seed=1):
+    rng = np.random.default_rng(seed)
+    env.reset()
+    rewards = 0.0
+    dones = 0
+    start = time.perf_counter()
+    for _ in range(steps):
+        _, reward, done = env.step(rng.integers(0, NUM_ACTIONS, env.num_envs))
+        rewards += float(reward.sum())
+        dones += int(done.sum())
+    elapsed = time.perf_counter() - start
+    env.close()
+    return env.num_envs * steps / elapsed, rewards, dones
+
+def main():
+    envs = int(sys.argv[1]) if len(sys.argv) > 1 else 256
+    steps = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+    workers = int(sys.argv[3]) if len(sys.argv) > 3 else os.cpu_count()
+    print(f"{envs} games x {steps} steps, random pilot")
+    for name, env in (("in-process", VecEnv(envs, seed=1)),
+                      (f"{workers} workers", ProcessVecEnv(envs, workers=workers, seed=1)),
+                      ("vectorized obstacles", VecEnv(envs, seed=1, vectorized=True))):
+        rate, rewards, dones = run(env, steps)
+        print(f"{name:22}: {rate:9.0f} env-steps/s  reward {rewards:8.0f}  episodes ended {dones}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,26 @@
+# Swept (continuous) box tests. A box (x, y, w, h) is given where it starts
+# a step and moves by (dx, dy) over it; two boxes hit if their interiors
+# overlap at any moment of the step, which is what colliderect() would find
+# on a frame taken at that moment. Fast movers therefore cannot pass
+# through each other between frames, whatever the step length.
+
+def swept_hit(ax, ay, aw, ah, adx, ady, bx, by, bw, bh, bdx=0, bdy=0):
+    # Box A's motion relative to box B, clipped per axis to the open time
+    # interval in which they overlap on that axis, intersected with [0, 1]
+    lo, hi = 0.0, 1.0
+    for a, size_a, b, size_b, v in ((ax, aw, bx, bw, adx - bdx), (ay, ah, by, bh, ady - bdy)):
+        if v == 0:
+            if not (a < b + size_b and a + size_a > b):
+                return False
+            continue
+        t1 = (b - size_a - a) / v
+        t2 = (b + size_b - a) / v
+        if t1 > t2:
+            t1, t2 = t2, t1
+        if t1 > lo:
+            lo = t1
+        if t2 < hi:
+            hi = t2
+        if lo >= hi:
+            return False
+    return True
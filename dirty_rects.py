@@ -0,0 +1,39 @@
+import pygame
+
+# Dirty-rectangle presenter for the play screen. Each frame erases last
+# frame's entity/HUD rects from the cached background, the caller redraws,
+# and only the old + new rects are pushed with pygame.display.update().
+# Any full-screen frame (overlays, menus, level change) invalidates it.
+# A crowded frame whose rects add up to more than FLIP_FRACTION of the
+# screen is flipped whole instead: past that, pushing the (overlapping)
+# rects one by one costs more than a flip.
+FLIP_FRACTION = 0.75
+
+class DirtyRenderer:
+    def __init__(self):
+        self.prev = []
+        self.background = None
+        self.valid = False
+        self.max_area = 0
+
+    def invalidate(self):
+        self.valid = False
+
+    def begin(self, surface, background):
+        self.max_area = surface.get_width() * surface.get_height() * FLIP_FRACTION
+        if not self.valid or background is not self.background:
+            self.valid = False
+            self.background = background
+            surface.blit(background, (0, 0))
+            return
+        for rect in self.prev:
+            surface.blit(background, rect, rect)
+
+    def end(self, rects):
+        changed = self.prev + rects
+        if self.valid and sum(r.width * r.height for r in changed) <= self.max_area:
+            pygame.display.update(changed)
+        else:
+            pygame.display.flip()
+            self.valid = True
+        self.prev = rects
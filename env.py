@@ -0,0 +1,81 @@
+import random
+
+import numpy as np
+import pygame
+
+import game16
+from game16 import HEIGHT, WIDTH, Game
+from vec_env import NUM_ACTIONS, OBS_SIZE, advance, observe, skip_screens
+
+# Gym-style wrapper around one Game, using vec_env's actions (arrow-key
+# bitmasks), rewards and episode rules, so steps follow Game.update() exactly:
+#
+#   env = StarCatcherEnv("state")                 or "pixels", downsample=4
+#   obs, info = env.reset(seed=1)
+#   obs, reward, terminated, truncated, info = env.step(action)
+#
+# "state" observations are vec_env's float32 vector and the game is never
+# drawn. "pixels" draws each step into a Surface that wraps a NumPy buffer
+# in the display's byte order and returns an (H, W, 3) RGB view of it,
+# keeping every `downsample`-th pixel: nothing is copied, so the view
+# changes on the next step (copy it to keep a frame).
+class StarCatcherEnv:
+    num_actions = NUM_ACTIONS
+
+    def __init__(self, observation="state", downsample=1, seed=None, max_steps=20000, frame_skip=1,
+                 ruleset=None, vectorized=False):
+        if observation not in ("state", "pixels"):
+            raise ValueError(f"unknown observation type {observation!r}")
+        self.observation = observation
+        self.rng = random.Random(seed)
+        self.max_steps = max_steps
+        self.frame_skip = frame_skip
+        self.ruleset = ruleset
+        self.vectorized = vectorized
+        self.game = None
+        self.steps = 0
+        self.state = np.zeros(OBS_SIZE, np.float32)
+        self.surface = None
+        if observation == "pixels":
+            if pygame.display.get_surface() is None:
+                game16.init_display(headless=True)
+            # BGRA bytes are the display's XRGB layout, so blits need no
+            # conversion; RGB is the same pixels read back to front
+            self.buffer = np.zeros((HEIGHT, WIDTH, 4), np.uint8)
+            self.surface = pygame.image.frombuffer(self.buffer, (WIDTH, HEIGHT), "BGRA")
+            self.pixels = self.buffer[::downsample, ::downsample, 2::-1]
+            self.observation_shape = self.pixels.shape
+        else:
+            self.observation_shape = self.state.shape
+
+    def reset(self, seed=None):
+        # Fonts are only loaded (and draw() only works) for a non-headless Game
+        self.game = Game(headless=self.surface is None, ruleset=self.ruleset, vectorized=self.vectorized,
+                         seed=seed if seed is not None else self.rng.randrange(2**32))
+        self.steps = 0
+        skip_screens(self.game)
+        return self.observe(), self.info()
+
+    def step(self, action):
+        game = self.game
+        reward, terminated = advance(game, action, self.frame_skip)
+        self.steps += 1
+        truncated = not terminated and self.steps >= self.max_steps
+        return self.observe(), reward, terminated, truncated, self.info()
+
+    def observe(self):
+        if self.surface is None:
+            observe(self.game, self.state)
+            return self.state.copy()
+        self.game.draw(self.surface)
+        # As the main loop does; with no mixer this only drops the requests
+        self.game.flush_audio()
+        return self.pixels
+
+    def info(self):
+        game = self.game
+        return {"score": game.score, "level": game.level_index, "crashes": game.player.crashes,
+                "tick": game.tick, "level_scores": list(game.level_scores)}
+
+    def close(self):
+        self.game = None
@@ -1,16 +1,30 @@
 import pygame
 import random
-import math
 import os
 import sys
+import time
 
-pygame.init()
-pygame.mixer.init()
+from asset_cache import AssetCache
+from assets import AssetLoader
+from audio import AudioManager
+from collision import swept_hit
+from dirty_rects import DirtyRenderer
+from pool import EntityPool
+from profiler import FrameProfiler, NullProfiler
+from rulesets import GAME16, RULESETS
+from spatial import SpatialHash
+from sprite_render import HUD_LAYER, OBSTACLE_LAYER, PLAYER_LAYER, STAR_LAYER, SpriteRenderer
+from star_sampler import StarSampler
+from sprites import (SWIRL_PAD, alpha_ramp, blackhole_sprite, disc_sprite, fill_sprite, photo_blackhole_sprite,
+                     photo_disc_sprite, photo_star_sprite, star_sprite, ufo_sprite)
+from text_cache import render_text, text_cache
 
 # Screen
 WIDTH, HEIGHT = 800, 600
-screen = pygame.display.set_mode((WIDTH, HEIGHT))
-pygame.display.set_caption("Cosmic Collector")
+screen = None
+
+# Headless mode: no window, no mixer, Game.update() driven by KeyState
+HEADLESS = os.environ.get("STAR_CATCHER_HEADLESS") == "1"
 
 # Colors
 TEXT_COLOR = (200, 220, 255)
@@ -23,118 +37,259 @@ WHITE = (255, 255, 255)
 BLUE = (50, 150, 255)
 HOVER_BLUE = (100, 200, 255)
 
+# Entity caps: spawns beyond these are skipped, recycled objects are reused
+MAX_OBSTACLES = 200
+MAX_STARS = 32
+STAR_SIZE = 20
+# Gap kept between a new star and the UFO, hazards and other stars
+STAR_CLEARANCE = 10
+# Fastest an obstacle moves per tick on either axis (see Obstacle.reset())
+MAX_OBSTACLE_SPEED = 3
+# Final scoreboard trail: one segment per tick, each fading by TRAIL_FADE alpha a tick
+TRAIL_SIZE = (30, 8)
+TRAIL_COLOR = (0, 255, 200)
+TRAIL_FADE = 10
+TRAIL_LENGTH = 255 // TRAIL_FADE
+# Best runs listed beside the final scoreboard
+LEADERBOARD_SIZE = 5
+
 # Assets (set these to your files)
 ASSET_PATH = os.path.dirname(os.path.abspath(__file__))
 COLLECT_SOUND_FILE = "catch.mp3"
 COLLISION_SOUND_FILE = "miss.mp3"
 BACKGROUND_MUSIC_FILE = "background.mp3"
+BACKGROUND_IMAGE_FILE = "background.png"
+ASTEROID_IMAGE_FILE = "asteroid.png"
+BLACKHOLE_IMAGE_FILE = "blackhole.png"
+STAR_IMAGE_FILE = "star.png"
+
+# Every size each image is drawn at and the effects decoded up front; the
+# asset cache (python asset_cache.py) stores these preprocessed on disk
+IMAGE_SIZES = {
+    BACKGROUND_IMAGE_FILE: [(WIDTH, HEIGHT)],
+    ASTEROID_IMAGE_FILE: [(size, size) for size in range(30, 51)],
+    BLACKHOLE_IMAGE_FILE: [(size, size) for size in range(40, 61)],
+    STAR_IMAGE_FILE: [(40, 40)],
+}
+SOUND_FILES = [COLLECT_SOUND_FILE, COLLISION_SOUND_FILE]
+
+# Window setup, deferred so importing this module never opens a display
+def init_display(headless=False):
+    global screen
+    if headless:
+        os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    pygame.display.init()
+    pygame.font.init()
+    screen = pygame.display.set_mode((WIDTH, HEIGHT))
+    pygame.display.set_caption("Cosmic Collector")
+    return screen
 
-# Try safe-loading sounds
-try:
-    collect_sound = pygame.mixer.Sound(os.path.join(ASSET_PATH, COLLECT_SOUND_FILE))
-except Exception:
-    collect_sound = None
-try:
-    collision_sound = pygame.mixer.Sound(os.path.join(ASSET_PATH, COLLISION_SOUND_FILE))
-except Exception:
-    collision_sound = None
-try:
+# Sounds, music and the starfield photo load on a background thread so the
+# window is up before anything is decoded; None until start_assets() runs
+# (always None when headless)
+assets = None
+
+def start_assets(textures=False):
+    global assets
+    assets = AssetLoader(ASSET_PATH, AssetCache(ASSET_PATH))
+    # One worker runs jobs in order, so the mixer is up before the sounds load
+    assets.submit("mixer", pygame.mixer.init)
+    assets.sound("collect", COLLECT_SOUND_FILE)
+    assets.sound("collision", COLLISION_SOUND_FILE)
+    assets.image("background", BACKGROUND_IMAGE_FILE, (WIDTH, HEIGHT))
+    assets.submit("music", start_music)
+    if textures:
+        assets.submit("textures", load_textures)
+    # Anything decoded from source this run gets written back for next time
+    assets.submit("cache", assets.cache.save)
+    return assets
+
+def start_music():
     pygame.mixer.music.load(os.path.join(ASSET_PATH, BACKGROUND_MUSIC_FILE))
     pygame.mixer.music.set_volume(0.3)
     pygame.mixer.music.play(-1)
-except Exception:
-    pass
-
-# Levels
-levels = [
-    {"name": "Pink City", "background_color": (255, 182, 193), "stars_needed": 10, "obstacles": 15, "blackholes": 2},
-    {"name": "Blue Space", "background_color": (30, 144, 255), "stars_needed": 12, "obstacles": 18, "blackholes": 3},
-    {"name": "Ocean Block", "background_color": (0, 105, 148), "stars_needed": 15, "obstacles": 22, "blackholes": 4}
-]
-
-# Riddles
-riddles = [
-    {"question": "I speak without a mouth and hear without ears. What am I?", "answer": "echo"},
-    {"question": "I’m tall when I’m young, and short when I’m old. What am I?", "answer": "candle"},
-    {"question": "What has keys but can’t open locks?", "answer": "piano"},
-    {"question": "The more of me you take, the more you leave behind. What am I?", "answer": "footsteps"},
-    {"question": "I have cities but no houses, forests but no trees, and water but no fish. What am I?", "answer": "map"},
-    {"question": "What can run but never walks, has a mouth but never talks?", "answer": "river"},
-    {"question": "I am always hungry and will die if not fed, but whatever I touch will soon turn red. What am I?", "answer": "fire"},
-    {"question": "I can fly without wings, cry without eyes. What am I?", "answer": "cloud"},
-    {"question": "The more you take away from me, the bigger I get. What am I?", "answer": "hole"},
-    {"question": "What has many teeth, but cannot bite?", "answer": "comb"},
-    {"question": "What goes up but never comes down?", "answer": "age"},
-    {"question": "What has a neck but no head?", "answer": "bottle"},
-    {"question": "What can travel around the world while staying in a corner?", "answer": "stamp"},
-    {"question": "What has hands but cannot clap?", "answer": "clock"},
-    {"question": "I’m light as a feather, yet the strongest man cannot hold me for long. What am I?", "answer": "breath"},
-    {"question": "What begins with T, ends with T, and has T in it?", "answer": "teapot"},
-    {"question": "What comes once in a minute, twice in a moment, but never in a thousand years?", "answer": "m"}
-]
+
+# Sprite textures: every (file, size) in IMAGE_SIZES except the background
+def load_textures():
+    return {(filename, size): assets.cache.image(filename, size)
+            for filename, sizes in IMAGE_SIZES.items() if filename != BACKGROUND_IMAGE_FILE
+            for size in sizes}
+
+textures = None
+
+# Scaled texture, or None until loaded (the sprite falls back to the primitive)
+def texture(filename, size):
+    global textures
+    if textures is None:
+        if assets is None or not assets.ready("textures"):
+            return None
+        textures = assets.get("textures", {})
+    return textures.get((filename, (size, size)))
+
+# Effect priorities for the audio manager: a crash may cut off a star chime,
+# never the other way round
+SOUND_PRIORITIES = {"collision": 2, "collect": 1}
+
+# None until the loader has the sound (or if it failed to load)
+def get_sound(name):
+    return assets.get(name) if assets is not None else None
+
+# Starfield photo scaled to the window once; False if it failed to load.
+# With the loader running it is None until the worker has decoded it.
+background_image = None
+
+def load_background_image():
+    global background_image
+    if background_image is None:
+        if assets is not None:
+            if not assets.ready("background"):
+                return None
+            background_image = assets.get("background", False)
+        else:
+            # The cache's mapped copy, already window-sized; the source is
+            # only decoded if python asset_cache.py has not been run
+            try:
+                background_image = AssetCache(ASSET_PATH).image(BACKGROUND_IMAGE_FILE, (WIDTH, HEIGHT))
+            except Exception:
+                background_image = False
+    return background_image or None
+
+# Key state for headless runs, indexable like pygame.key.get_pressed()
+class KeyState:
+    def __init__(self, pressed=()):
+        self.pressed = frozenset(pressed)
+
+    def __getitem__(self, key):
+        return key in self.pressed
+
+NO_KEYS = KeyState()
+
+# Per-tick input is recorded as a bitmask over these keys
+RECORDED_KEYS = (pygame.K_LEFT, pygame.K_RIGHT, pygame.K_UP, pygame.K_DOWN)
+
+def key_mask(keys):
+    mask = 0
+    for bit, key in enumerate(RECORDED_KEYS):
+        if keys[key]:
+            mask |= 1 << bit
+    return mask
+
+MASK_KEYS = [KeyState(key for bit, key in enumerate(RECORDED_KEYS) if mask >> bit & 1)
+             for mask in range(1 << len(RECORDED_KEYS))]
+
+# Fixed-timestep clock: all motion is tuned per tick at SIM_HZ, so the
+# simulation always advances in whole ticks and draw() interpolates between
+# the last two ticks by alpha, whatever the render rate is
+SIM_HZ = 60
+MAX_FRAME_TIME = 0.25  # longest real frame we catch up on (avoids a spiral of death)
+
+class FixedTimestep:
+    def __init__(self, hz=SIM_HZ, max_frame_time=MAX_FRAME_TIME):
+        self.dt = 1.0 / hz
+        self.max_frame_time = max_frame_time
+        self.accumulator = 0.0
+
+    def advance(self, elapsed):
+        # Returns how many sim ticks to run for `elapsed` seconds of real time
+        self.accumulator += min(elapsed, self.max_frame_time)
+        ticks = int(self.accumulator // self.dt)
+        self.accumulator -= ticks * self.dt
+        return ticks
+
+    @property
+    def alpha(self):
+        return self.accumulator / self.dt
+
+def lerp(a, b, t):
+    return b if t >= 1 else a + (b - a) * t
+
+# Levels and riddles of the default ruleset (see rulesets.py)
+levels = GAME16["levels"]
+riddles = GAME16["riddles"]
 
 
 # Helper function to draw wrapped text
 def draw_wrapped_text(surface, text, color, x, y, font, max_width, line_spacing=5):
-    words = text.split(' ')
-    lines = []
-    current_line = ''
-    for word in words:
-        test_line = current_line + word + ' '
-        if font.size(test_line)[0] <= max_width:
-            current_line = test_line
-        else:
-            lines.append(current_line)
-            current_line = word + ' '
-    lines.append(current_line)
-    for i, line in enumerate(lines):
-        surface.blit(font.render(line, True, color), (x, y + i * (font.get_height() + line_spacing)))
+    # Layout and line surfaces come from text_cache, so steady frames only blit
+    for i, line in enumerate(text_cache.wrap(font, text, max_width)):
+        surface.blit(render_text(font, line, color), (x, y + i * (font.get_height() + line_spacing)))
 
 # UFO / Player
 class UFO:
+    __slots__ = ("x", "y", "prev_x", "prev_y", "radius", "speed", "crashes", "rect")
+
     def __init__(self):
         self.x = 0
         self.y = HEIGHT // 2
+        self.prev_x = self.x
+        self.prev_y = self.y
         self.radius = 25
         self.speed = 5
         self.crashes = 0
+        self.rect = pygame.Rect(0, 0, self.radius*2, self.radius*2)
 
-    def draw(self, surface):
-        pygame.draw.ellipse(surface, (0, 200, 200), (self.x - 30, self.y - 15, 60, 30))
-        pygame.draw.ellipse(surface, (180, 250, 250), (self.x - 15, self.y - 25, 30, 20))
+    def sprite(self, alpha=1.0):
+        x = lerp(self.prev_x, self.x, alpha)
+        y = lerp(self.prev_y, self.y, alpha)
+        return ufo_sprite((0, 200, 200), (180, 250, 250)), (x - 30, y - 25)
+
+    def draw(self, surface, alpha=1.0):
+        return surface.blit(*self.sprite(alpha))
 
-    def move(self, keys):
+    def remember(self):
+        self.prev_x = self.x
+        self.prev_y = self.y
+
+    def move(self, keys, ticks=1):
+        # Held keys move at a constant speed, so several ticks are one move
+        step = self.speed * ticks
         if keys[pygame.K_LEFT]:
-            self.x -= self.speed
+            self.x -= step
         if keys[pygame.K_RIGHT]:
-            self.x += self.speed
+            self.x += step
         if keys[pygame.K_UP]:
-            self.y -= self.speed
+            self.y -= step
         if keys[pygame.K_DOWN]:
-            self.y += self.speed
+            self.y += step
         self.x = max(self.radius, min(WIDTH - self.radius, self.x))
         self.y = max(self.radius, min(HEIGHT - self.radius, self.y))
 
     def get_rect(self):
-        return pygame.Rect(self.x - self.radius, self.y - self.radius, self.radius*2, self.radius*2)
+        # One Rect per entity, re-synced in place: x/y are also set directly
+        # (level reset, intro), so it is refreshed here rather than in move()
+        rect = self.rect
+        rect.x = self.x - self.radius
+        rect.y = self.y - self.radius
+        return rect
 
 # Obstacles
 class Obstacle:
-    def __init__(self, kind="rock"):
+    __slots__ = ("kind", "size", "x", "y", "prev_x", "prev_y", "dx", "dy", "already_hit", "angle", "rect")
+
+    def __init__(self, kind="rock", rng=random):
+        self.rect = pygame.Rect(0, 0, 0, 0)
+        self.reset(kind, rng)
+
+    def reset(self, kind="rock", rng=random):
         self.kind = kind
-        self.size = random.randint(30, 50) if kind == "rock" else random.randint(40, 60)
-        self.x = random.randint(0, WIDTH - self.size)
-        self.y = random.randint(-HEIGHT, -self.size)
+        self.size = rng.randint(30, 50) if kind == "rock" else rng.randint(40, 60)
+        self.rect.size = (self.size, self.size)
+        self.x = rng.randint(0, WIDTH - self.size)
+        self.y = rng.randint(-HEIGHT, -self.size)
+        self.prev_x = self.x
+        self.prev_y = self.y
         if kind == "rock":
-            self.dx = random.uniform(-1.5, 1.5)
-            self.dy = random.uniform(-1.5, 1.5)
+            self.dx = rng.uniform(-1.5, 1.5)
+            self.dy = rng.uniform(-1.5, 1.5)
         else:
             self.dx = 0
-            self.dy = random.uniform(1, 3)
+            self.dy = rng.uniform(1, 3)
         self.already_hit = False
-        self.angle = random.uniform(0, 360)
+        self.angle = rng.uniform(0, 360)
 
-    def update(self):
+    def update(self, rng=random):
+        self.prev_x = self.x
+        self.prev_y = self.y
         self.x += self.dx
         self.y += self.dy
         if self.kind == "rock":
@@ -145,55 +300,137 @@ class Obstacle:
         else:
             if self.y > HEIGHT:
                 self.y = -self.size
-                self.x = random.randint(0, WIDTH - self.size)
+                self.x = rng.randint(0, WIDTH - self.size)
+                self.prev_x = self.x
+                self.prev_y = self.y
             self.angle += 5
 
-    def draw(self, surface):
+    def advance(self, rng, ticks):
+        # Several ticks at once; prev_x/prev_y go back to where the first one
+        # started (or where a black hole wrapped to), so the whole move can
+        # be swept as one segment
+        start_x, start_y = self.x, self.y
+        for _ in range(ticks):
+            before = self.y
+            self.update(rng)
+            if self.kind != "rock" and self.y < before:
+                start_x, start_y = self.x, self.y
+        self.prev_x = start_x
+        self.prev_y = start_y
+
+    def is_spent(self):
+        # Already hit the UFO, or a rock bouncing above the top edge: the y < 0
+        # bounce flips it back every frame, so it can never reach the screen
+        if self.already_hit:
+            return True
+        return self.kind == "rock" and self.y + abs(self.dy) + self.size <= 0
+
+    def sprite(self, alpha=1.0, textured=False):
+        # Cached sprites; black holes come from a table of every quantized angle.
+        # textured=True uses the photo textures once they have loaded.
+        x = lerp(self.prev_x, self.x, alpha)
+        y = lerp(self.prev_y, self.y, alpha)
+        offset = self.size//2 + SWIRL_PAD
+        pos = (int(x + self.size/2) - offset, int(y + self.size/2) - offset)
         if self.kind == "rock":
-            pygame.draw.circle(surface, GRAY, (int(self.x + self.size/2), int(self.y + self.size/2)), self.size//2)
-        else:
-            center = (int(self.x + self.size/2), int(self.y + self.size/2))
-            pygame.draw.circle(surface, BLACK, center, self.size//2)
-            end_x = center[0] + int(math.cos(math.radians(self.angle)) * self.size//2)
-            end_y = center[1] + int(math.sin(math.radians(self.angle)) * self.size//2)
-            pygame.draw.line(surface, RED, center, (end_x, end_y), 3)
+            tex = texture(ASTEROID_IMAGE_FILE, self.size) if textured else None
+            if tex is not None:
+                return photo_disc_sprite(ASTEROID_IMAGE_FILE, tex, self.size//2), pos
+            return disc_sprite(self.size//2, GRAY), pos
+        tex = texture(BLACKHOLE_IMAGE_FILE, self.size) if textured else None
+        if tex is not None:
+            return photo_blackhole_sprite(BLACKHOLE_IMAGE_FILE, tex, self.size, self.angle, RED), pos
+        return blackhole_sprite(self.size, self.angle, BLACK, RED), pos
+
+    def draw(self, surface, alpha=1.0):
+        return surface.blit(*self.sprite(alpha))
 
     def get_rect(self):
-        return pygame.Rect(self.x, self.y, self.size, self.size)
+        # int() truncates like the Rect constructor; attribute assignment would round
+        rect = self.rect
+        rect.x = int(self.x)
+        rect.y = int(self.y)
+        return rect
 
 # Star collectible
 class Star:
-    def __init__(self, player=None):
-        while True:
-            self.x = random.randint(50, WIDTH-50)
-            self.y = random.randint(50, HEIGHT-50)
-            if not player or math.hypot(self.x - player.x, self.y - player.y) > 50:
-                break
-        self.size = 20
+    __slots__ = ("x", "y", "size", "rect")
+
+    # Positions come from Game.place_star()
+    def __init__(self, x, y):
+        self.size = STAR_SIZE
+        self.rect = pygame.Rect(0, 0, self.size*2, self.size*2)
+        self.reset(x, y)
+
+    def reset(self, x, y):
+        self.x = x
+        self.y = y
+        self.rect.center = (x, y)
+
+    def sprite(self, textured=False):
+        pos = (self.x - self.size, self.y - self.size)
+        tex = texture(STAR_IMAGE_FILE, self.size*2) if textured else None
+        if tex is not None:
+            return photo_star_sprite(STAR_IMAGE_FILE, tex, self.size), pos
+        return star_sprite(self.size, YELLOW), pos
 
     def draw(self, surface):
-        points = []
-        for i in range(5):
-            angle = i * 72 - 90
-            x = self.x + self.size * math.cos(math.radians(angle))
-            y = self.y + self.size * math.sin(math.radians(angle))
-            points.append((x, y))
-            angle += 36
-            x = self.x + self.size//2 * math.cos(math.radians(angle))
-            y = self.y + self.size//2 * math.sin(math.radians(angle))
-            points.append((x, y))
-        pygame.draw.polygon(surface, YELLOW, points)
+        return surface.blit(*self.sprite())
 
     def get_rect(self):
-        return pygame.Rect(self.x - self.size, self.y - self.size, self.size*2, self.size*2)
+        return self.rect
 
 # Game
 class Game:
-    def __init__(self):
+    def __init__(self, headless=False, max_obstacles=MAX_OBSTACLES, vectorized=False, dirty_rects=False,
+                 profiler=None, seed=None, rng=None, sprites=False, ruleset=None, scores=None):
+        # Levels, riddles and variant behaviours; game9..game13 are rulesets too
+        self.ruleset = ruleset if ruleset is not None else GAME16
+        self.levels = self.ruleset["levels"]
+        self.riddles = self.ruleset["riddles"]
+        self.update_intro = getattr(self, "update_intro_" + self.ruleset["intro"])
+        self.draw_intro = getattr(self, "draw_intro_" + self.ruleset["intro"])
+        # Every random draw goes through self.rng, so a seed reproduces a run
+        self.seed = seed if seed is not None else random.randrange(2**32)
+        self.rng = rng if rng is not None else random.Random(self.seed)
+        self.tick = 0
+        self.recording = None  # per-tick key bitmasks while recording
+        self.recorded_events = []
+        self.headless = headless
+        self.max_obstacles = max_obstacles
+        self.vectorized = vectorized
+        self.dirty_rects = dirty_rects
+        # Optional dirty-rect presenter for the play screen (low-end kiosks)
+        self.dirty_renderer = DirtyRenderer() if dirty_rects else None
+        # Optional LayeredDirty sprite presenter using the photo textures; it
+        # needs entity objects, so not with the array obstacle engine
+        self.sprites = sprites
+        self.sprite_renderer = SpriteRenderer() if sprites and not vectorized else None
+        # Per-phase timings (NullProfiler does nothing); F3 toggles the overlay
+        self.profiler = profiler if profiler is not None else NullProfiler()
+        self.show_profiler = False
+        # Effects are queued during update() and played by flush_audio()
+        self.audio = None if headless else AudioManager(get_sound, SOUND_PRIORITIES)
+        # Optional ScoreStore: levels, crashes and riddle answers are queued to it
+        self.scores = scores
+        self.session = scores.start_session(self.ruleset["name"], self.seed) if scores is not None else None
+        self.session_ended = False
+        self.leaderboard = None  # Future of the best runs, asked for on reaching the scoreboard
+        self.leaderboard_blits = None
         self.level_index = 0
         self.player = UFO()
-        self.obstacles = []
-        self.stars = []
+        self.obstacle_pool = EntityPool(Obstacle, max_obstacles)
+        self.star_pool = EntityPool(Star, MAX_STARS)
+        self.obstacles = self.obstacle_pool.active
+        self.stars = self.star_pool.active
+        self.obstacle_grid = SpatialHash()
+        self.star_grid = SpatialHash()
+        self.star_sampler = StarSampler(WIDTH, HEIGHT)
+        # Optional NumPy engine; obstacles then live in the arrays, not self.obstacles
+        self.obstacle_array = None
+        if vectorized:
+            from obstacle_array import ObstacleArray
+            self.obstacle_array = ObstacleArray(WIDTH, HEIGHT)
         self.score = 0
         self.game_over = False
         self.level_complete = False
@@ -203,11 +440,14 @@ class Game:
         self.show_hint = False
         self.hint_shown = False
         self.show_level_intro = True
-        self.font = pygame.font.SysFont(None, 36)
-        self.medium_font = pygame.font.SysFont(None, 48)
-        self.large_font = pygame.font.SysFont(None, 72)
-        self.background_stars = [(random.randint(0, WIDTH), random.randint(0, HEIGHT)) for _ in range(100)]
-        self.remaining_riddles = riddles.copy()
+        if not headless:
+            self.font = pygame.font.SysFont(None, 36)
+            self.medium_font = pygame.font.SysFont(None, 48)
+            self.large_font = pygame.font.SysFont(None, 72)
+        self.background_stars = [(self.rng.randint(0, WIDTH), self.rng.randint(0, HEIGHT)) for _ in range(100)]
+        self.background_layer = None
+        self.background_waiting = False
+        self.remaining_riddles = self.riddles.copy()
         self.level_scores = []
         self.wrong_attempts = 0
 
@@ -221,19 +461,54 @@ class Game:
         self.restart_rect = pygame.Rect(WIDTH//2+20, HEIGHT//2+50, 100, 50)
 
         self.final_ufo_x = -150
-        self.final_trail = []
+        self.prev_final_ufo_x = self.final_ufo_x
+        self.final_trail = 0  # trail segments drawn behind the scoreboard UFO
+        self.celebration_stars = []
 
         self.reset_level()
 
+    def restart(self):
+        # Keeps options, the rng stream and any recording in progress
+        recording, events, tick, audio = self.recording, self.recorded_events, self.tick, self.audio
+        self.end_session()
+        self.__init__(self.headless, self.max_obstacles, self.vectorized, self.dirty_rects, self.profiler,
+                      self.seed, self.rng, self.sprites, self.ruleset, self.scores)
+        self.recording, self.recorded_events, self.tick, self.audio = recording, events, tick, audio
+        self.level_started = (tick, 0)
+
+    def start_recording(self):
+        self.recording = []
+        self.recorded_events = []
+
+    def perform(self, name, arg=None):
+        # Discrete player actions; logged by tick so a replay can re-apply them
+        if self.recording is not None:
+            self.recorded_events.append((self.tick, name, arg))
+        if name == "answer":
+            self.riddle_answer = arg
+            self.check_riddle_answer()
+        elif name == "hint":
+            self.hint_shown = True
+            self.show_hint = False
+        elif name == "try_again":
+            self.score = 0
+            self.player.crashes = 0
+            self.reset_level(preserve_level_index=True)
+            self.game_over = False
+        elif name == "restart":
+            self.restart()
+
     def handle_events(self):
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 return False
 
             if event.type == pygame.KEYDOWN:
-                if self.awaiting_riddle:
+                if event.key == pygame.K_F3 and self.profiler.enabled:
+                    self.show_profiler = not self.show_profiler
+                elif self.awaiting_riddle:
                     if event.key == pygame.K_RETURN:
-                        self.check_riddle_answer()
+                        self.perform("answer", self.riddle_answer)
                     elif event.key == pygame.K_BACKSPACE:
                         self.riddle_answer = self.riddle_answer[:-1]
                     else:
@@ -241,25 +516,21 @@ class Game:
                             self.riddle_answer += event.unicode
                 elif self.game_over:
                     if event.key == pygame.K_r:
-                        self.__init__()
+                        self.perform("restart")
 
             if event.type == pygame.MOUSEBUTTONDOWN:
                 mouse_pos = pygame.mouse.get_pos()
                 if self.awaiting_riddle and self.current_riddle:
                     if self.show_hint and self.hint_rect.collidepoint(mouse_pos):
-                        self.hint_shown = True
-                        self.show_hint = False
-                if self.game_over:
+                        self.perform("hint")
+                if self.game_over or (self.awaiting_riddle and self.show_riddle_buttons):
                     if self.try_again_rect.collidepoint(mouse_pos):
-                        self.score = 0
-                        self.player.crashes = 0
-                        self.reset_level(preserve_level_index=True)
-                        self.game_over = False
+                        self.perform("try_again")
                     if self.restart_rect.collidepoint(mouse_pos):
-                        self.__init__()
+                        self.perform("restart")
                 if self.show_win:
                     if self.restart_rect.collidepoint(mouse_pos):
-                        self.__init__()
+                        self.perform("restart")
 
         return True
 
@@ -268,8 +539,17 @@ class Game:
             return
         answer = self.current_riddle["answer"].strip().lower()
         given = self.riddle_answer.strip().lower()
+        if self.scores is not None:
+            self.scores.record_riddle(self.session, self.level_index, self.current_riddle["question"],
+                                      self.riddle_answer, given == answer)
         if given == answer:
             self.level_scores.append(self.score)
+            if self.scores is not None:
+                start_tick, start_crashes = self.level_started
+                self.scores.record_level(self.session, self.ruleset["name"], self.level_index,
+                                         self.levels[self.level_index]["name"], self.score,
+                                         self.player.crashes - start_crashes, (self.tick - start_tick) / SIM_HZ,
+                                         sum(self.level_scores))
             self.score = 0
             self.riddle_answer = ""
             self.wrong_attempts = 0
@@ -280,59 +560,292 @@ class Game:
             except ValueError:
                 pass
             if not self.remaining_riddles:
-                self.remaining_riddles = riddles.copy()
+                self.remaining_riddles = self.riddles.copy()
             self.current_riddle = None
             self.awaiting_riddle = False
             self.level_index += 1
-            if self.level_index >= len(levels):
-                self.show_scoreboard = True
+            if self.level_index >= len(self.levels):
+                self.end_session(won=True)
+                if self.ruleset["win"] == "scoreboard":
+                    self.show_scoreboard = True
+                    if self.scores is not None:
+                        self.leaderboard = self.scores.top_sessions(self.ruleset["name"], LEADERBOARD_SIZE)
+                else:
+                    self.show_win = True
             else:
+                if self.ruleset["reset_crashes_per_level"]:
+                    self.player.crashes = 0
                 self.reset_level()
         else:
+            rules = self.ruleset
             self.wrong_attempts += 1
             self.riddle_answer = ""
-            self.player.crashes += 1
-            if collision_sound:
-                collision_sound.play()
-            if self.player.crashes >= 5:
-                self.game_over = True
-            if self.wrong_attempts >= 3:
+            if rules["wrong_answer_crash"]:
+                self.player.crashes += 1
+                if self.scores is not None:
+                    self.scores.record_crash(self.session, self.level_index, self.tick, "riddle")
+                self.play_sound("collision")
+                if self.player.crashes >= 5:
+                    self.game_over = True
+            if rules["hint_after"] is not None and self.wrong_attempts >= rules["hint_after"]:
                 self.hint_shown = True
                 self.show_hint = False
+            self.show_riddle_buttons = rules["riddle_buttons"]
 
     def reset_level(self, preserve_level_index=False):
         if not preserve_level_index:
-            if self.level_index >= len(levels):
+            if self.level_index >= len(self.levels):
                 self.level_index = 0
+        self.background_layer = None
         self.awaiting_riddle = False
         self.level_complete = False
-        self.player.x = 0
+        self.player.x = self.ruleset["entry_start"] if self.ruleset["intro"] == "entry" else WIDTH // 2
         self.player.y = HEIGHT // 2
+        self.player.remember()
         self.show_level_intro = True
+        self.intro_ticks = 0
+        self.level_started = (self.tick, self.player.crashes)
+        self.show_riddle_buttons = False
         self.wrong_attempts = 0
         self.riddle_answer = ""
         self.current_riddle = None
         self.show_hint = False
         self.hint_shown = False
-        cfg = levels[self.level_index]
-        self.obstacles = [Obstacle("rock") for _ in range(cfg["obstacles"])]
-        self.obstacles += [Obstacle("blackhole") for _ in range(cfg["blackholes"])]
+        cfg = self.levels[self.level_index]
+        self.obstacle_pool.recycle_all()
+        self.obstacle_grid.clear()
+        if self.obstacle_array is not None:
+            self.obstacle_array.clear()
+        for _ in range(cfg["obstacles"] + self.level_index * self.ruleset["extra_rocks_per_level"]):
+            self.spawn_obstacle("rock")
+        for _ in range(cfg["blackholes"]):
+            self.spawn_obstacle("blackhole")
         stars_count = 5 + self.level_index * 2
-        self.stars = [Star(self.player) for _ in range(stars_count)]
+        self.star_pool.recycle_all()
+        self.star_grid.clear()
+        self.star_sampler.build(self.rng)
+        for _ in range(stars_count):
+            star = self.star_pool.spawn(*self.place_star())
+            if star is not None:
+                self.star_grid.insert(star, star.size)
+
+    def spawn_obstacle(self, kind):
+        if self.obstacle_array is not None:
+            # Roll the obstacle through the pool so both engines draw the same randoms
+            if len(self.obstacle_array) < self.max_obstacles:
+                self.obstacle_array.append(self.obstacle_pool.spawn(kind, self.rng))
+                self.obstacle_pool.recycle_all()
+            return
+        obs = self.obstacle_pool.spawn(kind, self.rng)
+        if obs is not None:
+            self.obstacle_grid.insert(obs, obs.size)
+
+    def place_star(self):
+        return self.star_sampler.sample(self.rng, STAR_SIZE, self.star_spot_blocked, self.star_spot_on_ufo)
+
+    def star_spot_on_ufo(self, x, y, w, h):
+        pad = STAR_CLEARANCE
+        return self.player.get_rect().colliderect((x - pad, y - pad, w + pad*2, h + pad*2))
+
+    def star_spot_blocked(self, x, y, w, h):
+        # Candidate star box (padded) against the UFO, obstacles and other stars
+        pad = STAR_CLEARANCE
+        spot = pygame.Rect(x - pad, y - pad, w + pad*2, h + pad*2)
+        if spot.colliderect(self.player.get_rect()):
+            return True
+        if self.obstacle_array is not None:
+            if self.obstacle_array.overlaps(spot):
+                return True
+        else:
+            for obs in self.obstacle_grid.query(*spot):
+                if spot.colliderect(obs.get_rect()):
+                    return True
+        for star in self.star_grid.query(*spot):
+            if spot.colliderect(star.get_rect()):
+                return True
+        return False
+
+    def crash(self):
+        self.play_sound("collision")
+        self.player.crashes += 1
+        if self.scores is not None:
+            self.scores.record_crash(self.session, self.level_index, self.tick, "obstacle")
+        if self.player.crashes >= 5:
+            self.game_over = True
+
+    def end_session(self, won=False):
+        # Closes the run in the score store (a win, a restart or quitting)
+        if self.scores is not None and not self.session_ended:
+            self.session_ended = True
+            self.scores.end_session(self.session, won)
+
+    def layout_leaderboard(self):
+        # Text beside the final scoreboard, laid out once the query is back;
+        # this run is the green line
+        if self.leaderboard.exception() is not None:
+            return []
+        x, y = WIDTH//2-200, HEIGHT//2+60
+        blits = [(render_text(self.medium_font, "BEST RUNS", YELLOW), (x, y))]
+        for i, (session, total, *_) in enumerate(self.leaderboard.result()):
+            color = GREEN if session == self.session else WHITE
+            blits.append((render_text(self.font, f"{i+1}. {total} Energy", color), (x, y + 50 + i * 36)))
+        return blits
 
-    def update(self):
+    def compose_background(self):
+        # Level color + starfield photo (added, so its black adds nothing) + the
+        # 100 background dots, built once per level and blitted as one Surface
+        layer = pygame.Surface((WIDTH, HEIGHT))
+        if pygame.display.get_surface() is not None:
+            layer = layer.convert()
+        layer.fill(self.levels[self.level_index]["background_color"])
+        image = load_background_image() if self.ruleset["background_photo"] else None
+        # Photo still decoding: draw() recomposes once the loader has it
+        self.background_waiting = self.ruleset["background_photo"] and image is None and background_image is None
+        if image is not None:
+            layer.blit(image, (0, 0), special_flags=pygame.BLEND_ADD)
+        for sx, sy in self.background_stars:
+            pygame.draw.circle(layer, WHITE, (sx, sy), 2)
+        return layer
+
+    def draw_intro_entry(self, surface, cfg, alpha):
+        surface.blit(render_text(self.large_font, f"LEVEL {self.level_index+1}: {cfg['name']}", YELLOW), (WIDTH//2-200, HEIGHT//2-50))
+        surface.blit(render_text(self.medium_font, "UFO entering...", GREEN), (WIDTH//2-150, HEIGHT//2+20))
+        self.player.draw(surface, alpha)
+
+    def draw_intro_level_name(self, surface, cfg, alpha):
+        surface.blit(fill_sprite((WIDTH, HEIGHT), (0, 0, 0, 180)), (0, 0))
+        surface.blit(render_text(self.large_font, cfg["name"], YELLOW), (WIDTH//2-150, HEIGHT//2-50))
+
+    def draw_buttons(self, surface):
+        # Try Again / Restart, on the game over screen and after a wrong riddle answer
+        mouse_pos = pygame.mouse.get_pos()
+        pygame.draw.rect(surface, HOVER_BLUE if self.try_again_rect.collidepoint(mouse_pos) else BLUE, self.try_again_rect)
+        pygame.draw.rect(surface, HOVER_BLUE if self.restart_rect.collidepoint(mouse_pos) else BLUE, self.restart_rect)
+        surface.blit(render_text(self.font, "Try Again", WHITE), (self.try_again_rect.x+5, self.try_again_rect.y+12))
+        surface.blit(render_text(self.font, "Restart", WHITE), (self.restart_rect.x+15, self.restart_rect.y+12))
+
+    def draw_summary(self, surface, alpha):
+        # Win screen of the rulesets without the animated scoreboard
+        surface.fill(BLACK)
+        if self.ruleset["win"] == "celebration":
+            for x, y, size in self.celebration_stars:
+                pygame.draw.circle(surface, YELLOW, (x, y), size)
+            surface.blit(ufo_sprite((0, 200, 200), (180, 250, 250)),
+                         (lerp(self.prev_final_ufo_x, self.final_ufo_x, alpha) - 30, HEIGHT//4 - 25))
+        surface.blit(render_text(self.large_font, "YOU WIN!", YELLOW), (WIDTH//2-180, 50))
+        surface.blit(render_text(self.medium_font, "LEVEL SCORE SUMMARY", YELLOW), (WIDTH//2-180, 150))
+        y = 220
+        for i, score in enumerate(self.level_scores):
+            surface.blit(render_text(self.font, f"Level {i+1}: {self.levels[i]['name']} - {score} Energy", WHITE), (WIDTH//2-180, y))
+            y += 40
+        surface.blit(render_text(self.font, f"Total Energy: {sum(self.level_scores)}", GREEN), (WIDTH//2-180, y+20))
+        self.restart_rect = pygame.Rect(WIDTH//2-60, HEIGHT-110, 120, 50)
+        mouse_pos = pygame.mouse.get_pos()
+        pygame.draw.rect(surface, HOVER_BLUE if self.restart_rect.collidepoint(mouse_pos) else BLUE, self.restart_rect)
+        surface.blit(render_text(self.font, "Restart", WHITE), (self.restart_rect.x+15, self.restart_rect.y+12))
+
+    def draw_loading(self, surface, loaded, total):
+        # Progress bar under the level intro while assets stream in
+        bar = pygame.Rect(WIDTH//2-150, HEIGHT-80, 300, 16)
+        pygame.draw.rect(surface, GRAY, bar, 2)
+        pygame.draw.rect(surface, GREEN, (bar.x+3, bar.y+3, (bar.width-6) * loaded // max(total, 1), bar.height-6))
+        surface.blit(render_text(self.font, f"Loading {loaded}/{total}", WHITE), (bar.x, bar.y-30))
+
+    def play_sound(self, name):
+        if self.audio is not None:
+            self.audio.request(name)
+
+    def flush_audio(self):
+        # End of frame: play what this frame's ticks asked for
+        if self.audio is not None:
+            self.audio.flush()
+
+    def present(self, surface, rects=None):
+        # Full flip unless a dirty-rect or sprite frame handed over the rects it
+        # touched. An off-screen target (env.py observations) is never shown;
+        # the next frame into it is drawn whole.
+        shown = surface is pygame.display.get_surface()
+        if rects is None or not shown:
+            if self.dirty_renderer is not None:
+                self.dirty_renderer.invalidate()
+            if self.sprite_renderer is not None:
+                self.sprite_renderer.invalidate()
+            if shown:
+                pygame.display.flip()
+        elif self.sprite_renderer is not None:
+            pygame.display.update(rects)
+        else:
+            self.dirty_renderer.end(rects)
+
+    def draw_sprites(self, surface, alpha):
+        # Play screen through the LayeredDirty group: only changed sprites redraw
+        renderer = self.sprite_renderer
+        for obs in self.obstacles:
+            renderer.show(obs, OBSTACLE_LAYER, *obs.sprite(alpha, textured=True))
+        for star in self.stars:
+            renderer.show(star, STAR_LAYER, *star.sprite(textured=True))
+        renderer.show(self.player, PLAYER_LAYER, *self.player.sprite(alpha))
+        t = self.profiler.start()
+        renderer.show("energy", HUD_LAYER, render_text(self.font, f"Energy: {self.score}", WHITE), (10, 10))
+        renderer.show("crashes", HUD_LAYER, render_text(self.font, f"Crashes: {self.player.crashes}", RED), (10, 50))
+        renderer.show("level", HUD_LAYER, render_text(self.font, f"Level {self.level_index+1}", GREEN), (10, 90))
+        self.profiler.stop("hud_text", t)
+        return renderer.draw(surface, self.background_layer)
+
+    def update_intro_entry(self):
+        # UFO flies in from the left; play starts once it is at the centre
+        if self.player.x < WIDTH // 2:
+            self.player.x = min(self.player.x + self.ruleset["entry_speed"], WIDTH // 2)
+        else:
+            self.show_level_intro = False
+
+    def update_intro_level_name(self):
+        # Level name holds the screen for a fixed number of ticks
+        self.intro_ticks += 1
+        if self.intro_ticks >= self.ruleset["intro_ticks"]:
+            self.show_level_intro = False
+
+    def update_celebration(self):
+        # Win screen UFO crossing the sky over falling stars
+        if not self.celebration_stars:
+            self.celebration_stars = [[self.rng.randint(0, WIDTH), self.rng.randint(0, HEIGHT//2), self.rng.randint(1, 3)]
+                                      for _ in range(50)]
+        self.final_ufo_x += 3
+        if self.final_ufo_x > WIDTH + 50:
+            self.final_ufo_x = self.prev_final_ufo_x = -50
+        for star in self.celebration_stars:
+            star[1] += star[2]
+            if star[1] > HEIGHT//2:
+                star[0], star[1] = self.rng.randint(0, WIDTH), 0
+
+    def playing(self):
+        return not (self.show_win or self.show_scoreboard or self.game_over or self.awaiting_riddle
+                    or self.show_level_intro)
+
+    def update(self, keys=None, ticks=1):
+        # One fixed sim tick; positions before it are kept for draw() interpolation.
+        # Headless runs may pass ticks > 1 to play several ticks as one step:
+        # the moves are the same and collisions are swept over the whole step
+        if ticks > 1 and (self.recording is not None or not self.playing()):
+            # Recordings hold one key mask per tick, and the screens around play run per tick
+            for _ in range(ticks):
+                self.update(keys)
+            return
+        if self.recording is not None:
+            if keys is None:
+                keys = NO_KEYS if self.headless else pygame.key.get_pressed()
+            self.recording.append(key_mask(keys))
+        self.tick += ticks
+        self.player.remember()
+        self.prev_final_ufo_x = self.final_ufo_x
         if self.show_win:
+            if self.ruleset["win"] == "celebration":
+                self.update_celebration()
             return
         if self.show_scoreboard:
             self.final_ufo_x += 4
-            trail_y = HEIGHT // 2 + 10
-            self.final_trail.append((self.final_ufo_x, trail_y, 255))
-            new_trail = []
-            for (tx, ty, a) in self.final_trail:
-                a -= 10
-                if a > 0:
-                    new_trail.append((tx, ty, a))
-            self.final_trail = new_trail
+            # A segment is left at each tick's position; older ones have faded out
+            self.final_trail = min(self.final_trail + 1, TRAIL_LENGTH)
             if self.final_ufo_x > WIDTH + 200:
                 self.win_timer += 1
                 if self.win_timer > 120:  # after ~2 seconds
@@ -341,133 +854,281 @@ class Game:
             return
         if self.game_over or self.awaiting_riddle or self.show_level_intro:
             if self.show_level_intro:
-                if self.player.x < WIDTH // 2:
-                    self.player.x += 10
-                else:
-                    self.show_level_intro = False
+                self.update_intro()
             return
-        keys = pygame.key.get_pressed()
-        self.player.move(keys)
-        if random.randint(1, 120) == 1:
-            kind = random.choice(["rock", "blackhole"])
-            self.obstacles.append(Obstacle(kind))
-        for obs in self.obstacles:
-            obs.update()
-            if self.player.get_rect().colliderect(obs.get_rect()) and not obs.already_hit:
-                if collision_sound:
-                    collision_sound.play()
-                self.player.crashes += 1
-                obs.already_hit = True
-                if self.player.crashes >= 5:
-                    self.game_over = True
-        for star in self.stars[:]:
-            if self.player.get_rect().colliderect(star.get_rect()):
-                if collect_sound:
-                    collect_sound.play()
-                self.stars.remove(star)
+        if keys is None:
+            keys = NO_KEYS if self.headless else pygame.key.get_pressed()
+        player = self.player
+        player.move(keys, ticks)
+        chance = self.ruleset["spawn_chance"]
+        if chance:
+            for _ in range(ticks):
+                if self.rng.randint(1, chance) == 1:
+                    kind = self.rng.choice(["rock", "blackhole"])
+                    self.spawn_obstacle(kind)
+        prof = self.profiler
+        player_rect = player.get_rect()
+        # The UFO box where the step began and how far it moved: hits are
+        # tested along the whole move, not just where it ends, so a fast UFO
+        # or a long step cannot pass through an obstacle or a star
+        w, h = player_rect.size
+        sx, sy = player.prev_x - player.radius, player.prev_y - player.radius
+        mx, my = player_rect.x - sx, player_rect.y - sy
+        swept = (min(sx, player_rect.x), min(sy, player_rect.y), w + abs(mx), h + abs(my))
+        t = prof.start()
+        if self.obstacle_array is not None:
+            # Vectorized move/bounce/wrap/rotate, then one batch collision test
+            if ticks == 1:
+                self.obstacle_array.update(self.rng)
+            else:
+                self.obstacle_array.advance(self.rng, ticks)
+            prof.stop("obstacle_update", t)
+            t = prof.start()
+            for _ in self.obstacle_array.collide(player_rect, (sx, sy)):
+                self.crash()
+            self.obstacle_array.recycle_spent()
+        else:
+            grid = self.obstacle_grid
+            rng = self.rng
+            if ticks == 1:
+                for obs in self.obstacles:
+                    obs.update(rng)
+            else:
+                for obs in self.obstacles:
+                    obs.advance(rng, ticks)
+            grid.refresh(self.obstacles)
+            prof.stop("obstacle_update", t)
+            t = prof.start()
+            # Broadphase: only obstacles sharing a grid cell with the UFO's path,
+            # widened by how far they can move in the step, reach the exact tests
+            reach = MAX_OBSTACLE_SPEED * ticks
+            x, y, sw, sh = swept
+            for obs in grid.query(x - reach, y - reach, sw + reach*2, sh + reach*2):
+                if obs.already_hit:
+                    continue
+                if player_rect.colliderect(obs.get_rect()) or swept_hit(
+                        sx, sy, w, h, mx, my, obs.prev_x, obs.prev_y, obs.size, obs.size,
+                        obs.x - obs.prev_x, obs.y - obs.prev_y):
+                    obs.already_hit = True
+                    self.crash()
+            self.obstacle_pool.recycle_if(Obstacle.is_spent, grid.remove)
+        prof.stop("collision", t)
+        t = prof.start()
+        for star in self.star_grid.query(*swept):
+            rect = star.get_rect()
+            if player_rect.colliderect(rect) or swept_hit(sx, sy, w, h, mx, my, *rect):
+                self.play_sound("collect")
                 self.score += 10
-                self.stars.append(Star(self.player))
-        needed = levels[self.level_index]["stars_needed"] * 10
+                # Out of the grid while placing, so it does not block itself
+                self.star_grid.remove(star)
+                star.reset(*self.place_star())
+                self.star_grid.insert(star, star.size)
+        prof.stop("stars", t)
+        needed = self.levels[self.level_index]["stars_needed"] * 10
         if self.score >= needed and not self.awaiting_riddle:
             self.level_complete = True
             self.awaiting_riddle = True
             self.riddle_answer = ""
             self.wrong_attempts = 0
-            self.show_hint = True
+            self.show_hint = self.ruleset["hint_button"]
             self.hint_shown = False
             if not self.remaining_riddles:
-                self.remaining_riddles = riddles.copy()
-            self.current_riddle = random.choice(self.remaining_riddles)
+                self.remaining_riddles = self.riddles.copy()
+            self.current_riddle = self.rng.choice(self.remaining_riddles)
 
-    def draw(self, surface):
+    def draw(self, surface, alpha=1.0):
+        if self.show_win and self.ruleset["win"] != "scoreboard":
+            self.draw_summary(surface, alpha)
+            self.present(surface)
+            return
         if self.show_win:
             surface.fill(BLACK)
-            surface.blit(self.large_font.render("YOU WIN ", True, GREEN), (WIDTH//2-150, HEIGHT//2-120))
+            surface.blit(render_text(self.large_font, "YOU WIN ", GREEN), (WIDTH//2-150, HEIGHT//2-120))
             total = sum(self.level_scores)
-            surface.blit(self.medium_font.render(f"Total Energy: {total}", True, YELLOW), (WIDTH//2-150, HEIGHT//2-40))
+            surface.blit(render_text(self.medium_font, f"Total Energy: {total}", YELLOW), (WIDTH//2-150, HEIGHT//2-40))
             self.restart_rect = pygame.Rect(WIDTH//2-60, HEIGHT//2+40, 120, 50)
             mouse_pos = pygame.mouse.get_pos()
             pygame.draw.rect(surface, HOVER_BLUE if self.restart_rect.collidepoint(mouse_pos) else BLUE, self.restart_rect)
-            surface.blit(self.font.render("Restart", True, WHITE), (self.restart_rect.x+15, self.restart_rect.y+12))
-            pygame.display.flip()
+            surface.blit(render_text(self.font, "Restart", WHITE), (self.restart_rect.x+15, self.restart_rect.y+12))
+            self.present(surface)
             return
         if self.show_scoreboard:
+            # A black shade over the black fill would change nothing, so there is none
             surface.fill(BLACK)
-            overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-            overlay.fill((0, 0, 0, 220))
-            surface.blit(overlay, (0, 0))
-            surface.blit(self.large_font.render(" FINAL SCOREBOARD ", True, YELLOW), (WIDTH//2-300, 40))
+            surface.blit(render_text(self.large_font, " FINAL SCOREBOARD ", YELLOW), (WIDTH//2-300, 40))
             y = 140
             for i, s in enumerate(self.level_scores):
-                name = levels[i]['name'] if i < len(levels) else f"Level {i+1}"
-                surface.blit(self.font.render(f"{i+1}. {name} — {s} Energy", True, WHITE), (WIDTH//2-200, y))
+                name = self.levels[i]['name'] if i < len(self.levels) else f"Level {i+1}"
+                surface.blit(render_text(self.font, f"{i+1}. {name} — {s} Energy", WHITE), (WIDTH//2-200, y))
                 y += 36
             total = sum(self.level_scores)
-            surface.blit(self.font.render(f"Total Energy: {total}", True, GREEN), (WIDTH//2-200, y+10))
-            for (tx, ty, a) in self.final_trail:
-                surf = pygame.Surface((30, 8), pygame.SRCALPHA)
-                surf.fill((0, 255, 200, a//2))
-                surface.blit(surf, (tx, ty))
-            pygame.draw.ellipse(surface, (0, 200, 200), (self.final_ufo_x, HEIGHT//2, 60, 30))
-            pygame.display.flip()
+            surface.blit(render_text(self.font, f"Total Energy: {total}", GREEN), (WIDTH//2-200, y+10))
+            if self.leaderboard_blits is None and self.leaderboard is not None and self.leaderboard.done():
+                self.leaderboard_blits = self.layout_leaderboard()
+            if self.leaderboard_blits:
+                surface.blits(self.leaderboard_blits, doreturn=False)
+            # Oldest segment first; the one left `age` ticks ago is 4*age px behind
+            ramp = alpha_ramp(TRAIL_SIZE, TRAIL_COLOR)
+            ty = HEIGHT // 2 + 10
+            for age in range(self.final_trail, 0, -1):
+                surface.blit(ramp[(255 - TRAIL_FADE * age) // 2], (self.final_ufo_x - 4 * (age - 1), ty))
+            pygame.draw.ellipse(surface, (0, 200, 200), (lerp(self.prev_final_ufo_x, self.final_ufo_x, alpha), HEIGHT//2, 60, 30))
+            self.present(surface)
             return
-        cfg = levels[self.level_index]
-        surface.fill(cfg["background_color"])
-        for sx, sy in self.background_stars:
-            pygame.draw.circle(surface, WHITE, (sx, sy), 2)
+        cfg = self.levels[self.level_index]
+        if self.background_layer is None or (self.background_waiting and assets.ready("background")):
+            self.background_layer = self.compose_background()
+        riddle_overlay = self.awaiting_riddle and self.current_riddle
+        if self.sprite_renderer is not None and not (self.show_level_intro or self.game_over or riddle_overlay
+                                                     or self.show_profiler):
+            self.present(surface, self.draw_sprites(surface, alpha))
+            return
+        dirty = self.dirty_renderer is not None and not (self.show_level_intro or self.game_over or riddle_overlay)
+        if dirty:
+            self.dirty_renderer.begin(surface, self.background_layer)
+        else:
+            surface.blit(self.background_layer, (0, 0))
         if self.show_level_intro:
-            surface.blit(self.large_font.render(f"LEVEL {self.level_index+1}: {cfg['name']}", True, YELLOW), (WIDTH//2-200, HEIGHT//2-50))
-            surface.blit(self.medium_font.render("UFO entering...", True, GREEN), (WIDTH//2-150, HEIGHT//2+20))
-            self.player.draw(surface)
-            pygame.display.flip()
+            self.draw_intro(surface, cfg, alpha)
+            if assets is not None and not assets.done():
+                self.draw_loading(surface, *assets.progress())
+            self.present(surface)
             return
         if self.game_over:
             surface.fill(BLACK)
-            surface.blit(self.large_font.render("GAME OVER", True, RED), (WIDTH//2-150, HEIGHT//2-100))
-            surface.blit(self.font.render(f"Final Energy: {sum(self.level_scores)+self.score}", True, YELLOW), (WIDTH//2-150, HEIGHT//2-40))
-            mouse_pos = pygame.mouse.get_pos()
-            pygame.draw.rect(surface, HOVER_BLUE if self.try_again_rect.collidepoint(mouse_pos) else BLUE, self.try_again_rect)
-            pygame.draw.rect(surface, HOVER_BLUE if self.restart_rect.collidepoint(mouse_pos) else BLUE, self.restart_rect)
-            surface.blit(self.font.render("Try Again", True, WHITE), (self.try_again_rect.x+5, self.try_again_rect.y+12))
-            surface.blit(self.font.render("Restart", True, WHITE), (self.restart_rect.x+15, self.restart_rect.y+12))
-            pygame.display.flip()
+            surface.blit(render_text(self.large_font, "GAME OVER", RED), (WIDTH//2-150, HEIGHT//2-100))
+            surface.blit(render_text(self.font, f"Final Energy: {sum(self.level_scores)+self.score}", YELLOW), (WIDTH//2-150, HEIGHT//2-40))
+            self.draw_buttons(surface)
+            self.present(surface)
             return
+        rects = []
+        if self.obstacle_array is not None:
+            rects += self.obstacle_array.draw(surface, alpha)
         for obs in self.obstacles:
-            obs.draw(surface)
+            rects.append(obs.draw(surface, alpha))
         for star in self.stars:
-            star.draw(surface)
-        self.player.draw(surface)
-        surface.blit(self.font.render(f"Energy: {self.score}", True, WHITE), (10, 10))
-        surface.blit(self.font.render(f"Crashes: {self.player.crashes}", True, RED), (10, 50))
-        surface.blit(self.font.render(f"Level {self.level_index+1}", True, GREEN), (10, 90))
-        if self.awaiting_riddle and self.current_riddle:
-            overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-            overlay.fill((0, 0, 0, 220))
-            surface.blit(overlay, (0, 0))
+            rects.append(star.draw(surface))
+        rects.append(self.player.draw(surface, alpha))
+        t = self.profiler.start()
+        rects.append(surface.blit(render_text(self.font, f"Energy: {self.score}", WHITE), (10, 10)))
+        rects.append(surface.blit(render_text(self.font, f"Crashes: {self.player.crashes}", RED), (10, 50)))
+        rects.append(surface.blit(render_text(self.font, f"Level {self.level_index+1}", GREEN), (10, 90)))
+        self.profiler.stop("hud_text", t)
+        if self.show_profiler:
+            # Overlay lines are not tracked as dirty rects, so present it with a full flip
+            self.profiler.draw_overlay(surface, self.font, render_text, WHITE)
+            dirty = False
+        if riddle_overlay:
+            surface.blit(fill_sprite((WIDTH, HEIGHT), (0, 0, 0, 220)), (0, 0))
             draw_wrapped_text(surface, "RIDDLE:", YELLOW, WIDTH//2-300, HEIGHT//2-120, self.medium_font, 600)
             draw_wrapped_text(surface, self.current_riddle["question"], WHITE, WIDTH//2-300, HEIGHT//2-70, self.font, 600)
             ans_disp = self.riddle_answer if self.riddle_answer else "_"
-            surface.blit(self.font.render(f"Your Answer: {ans_disp}", True, GREEN), (WIDTH//2-300, HEIGHT//2))
+            surface.blit(render_text(self.font, f"Your Answer: {ans_disp}", GREEN), (WIDTH//2-300, HEIGHT//2))
             if self.show_hint:
                 self.hint_rect = pygame.Rect(WIDTH//2-60, HEIGHT//2+40, 120, 40)
                 mouse_pos = pygame.mouse.get_pos()
                 pygame.draw.rect(surface, HOVER_BLUE if self.hint_rect.collidepoint(mouse_pos) else BLUE, self.hint_rect)
-                surface.blit(self.font.render("Hint", True, WHITE), (self.hint_rect.x+30, self.hint_rect.y+8))
+                surface.blit(render_text(self.font, "Hint", WHITE), (self.hint_rect.x+30, self.hint_rect.y+8))
             if self.hint_shown:
                 hint_text = f"Hint: {self.current_riddle['answer'][0].upper()}..."
-                surface.blit(self.font.render(hint_text, True, YELLOW), (WIDTH//2-300, HEIGHT//2+100))
-        pygame.display.flip()
+                surface.blit(render_text(self.font, hint_text, YELLOW), (WIDTH//2-300, HEIGHT//2+100))
+            if self.show_riddle_buttons:
+                self.draw_buttons(surface)
+        self.present(surface, rects if dirty else None)
+
+# Step the simulation with no draw() and no audio; pilot(game) returns key state
+# ticks > 1 plays that many ticks per update() (swept collisions, see Game.update())
+def run_headless(frames, game=None, pilot=None, ticks=1):
+    if game is None:
+        game = Game(headless=True)
+    for done in range(0, frames, ticks):
+        game.update(pilot(game) if pilot else NO_KEYS, min(ticks, frames - done))
+    return game
 
 # Main loop
-def main():
+# ruleset picks the variant (game9.py etc. pass theirs); --rules NAME overrides
+def main(ruleset=None):
+    if "--rules" in sys.argv:
+        ruleset = RULESETS[sys.argv[sys.argv.index("--rules") + 1]]
+    if HEADLESS or "--headless" in sys.argv:
+        frames = int(sys.argv[-1]) if sys.argv[-1].isdigit() else 60 * 60
+        start = time.perf_counter()
+        run_headless(frames, Game(headless=True, ruleset=ruleset))
+        elapsed = time.perf_counter() - start
+        print(f"{frames} frames in {elapsed:.3f}s ({frames / elapsed:.0f} frames/s)")
+        sys.exit()
+    launched = time.perf_counter()
+    init_display()
+    start_assets(textures="--sprites" in sys.argv)
     clock = pygame.time.Clock()
-    game = Game()
+    # Render rate is independent of the 60 Hz sim: --fps N caps it, --fps 0 uncaps
+    render_fps = int(sys.argv[sys.argv.index("--fps") + 1]) if "--fps" in sys.argv else 60
+    timestep = FixedTimestep()
+    # --profile out.json|out.csv dumps per-phase timings at exit
+    profile_path = sys.argv[sys.argv.index("--profile") + 1] if "--profile" in sys.argv else None
+    prof = FrameProfiler()
+    # --seed N reproduces a run; --record out.json saves its input for replay.py
+    seed = int(sys.argv[sys.argv.index("--seed") + 1]) if "--seed" in sys.argv else None
+    record_path = sys.argv[sys.argv.index("--record") + 1] if "--record" in sys.argv else None
+    # --sprites draws play with a LayeredDirty group and the photo textures
+    sprites = "--sprites" in sys.argv
+    # --scores FILE keeps scores somewhere else than scores.db, --no-scores keeps none
+    scores = None
+    if "--no-scores" not in sys.argv:
+        import sqlite3
+        from score_store import ScoreStore
+        scores_path = sys.argv[sys.argv.index("--scores") + 1] if "--scores" in sys.argv else os.path.join(ASSET_PATH, "scores.db")
+        try:
+            scores = ScoreStore(scores_path)
+        except sqlite3.Error as e:
+            # A read-only folder or a broken file: play on without saving scores
+            print(f"scores not saved ({scores_path}: {e})", file=sys.stderr)
+    game = Game(dirty_rects="--dirty" in sys.argv, profiler=prof, seed=seed, sprites=sprites, ruleset=ruleset,
+                scores=scores)
+    if record_path:
+        game.start_recording()
     running = True
+    # Startup timing: window drawn vs. every asset loaded, both from main()
+    first_frame_ms = ready_ms = None
+    last = time.perf_counter()
     while running:
+        prof.begin_frame()
+        now = time.perf_counter()
+        ticks = timestep.advance(now - last)
+        last = now
+        t = prof.start()
         running = game.handle_events()
-        game.update()
-        game.draw(screen)
-        clock.tick(60)
+        prof.stop("handle_events", t)
+        t = prof.start()
+        for _ in range(ticks):
+            game.update()
+        prof.stop("update", t)
+        t = prof.start()
+        game.flush_audio()
+        prof.stop("audio", t)
+        t = prof.start()
+        game.draw(screen, timestep.alpha)
+        prof.stop("draw", t)
+        prof.count("obstacles", len(game.obstacles) + (len(game.obstacle_array) if game.obstacle_array is not None else 0))
+        prof.count("stars", len(game.stars))
+        prof.end_frame()
+        if first_frame_ms is None:
+            first_frame_ms = (time.perf_counter() - launched) * 1000
+            print(f"first frame after {first_frame_ms:.0f} ms")
+        if ready_ms is None:
+            ready_ms = assets.ready_ms()
+            if ready_ms is not None:
+                print(f"assets loaded after {ready_ms + (assets.started - launched) * 1000:.0f} ms")
+        clock.tick(render_fps)
+    assets.shutdown()
+    if scores is not None:
+        game.end_session()
+        scores.close()
+    if profile_path:
+        prof.dump(profile_path)
+    if record_path:
+        from replay import save_recording
+        save_recording(game, record_path)
     pygame.quit()
     sys.exit()
 
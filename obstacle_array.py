@@ -0,0 +1,184 @@
+import random
+
+import numpy as np
+
+from sprites import SWIRL_PAD, blackhole_sprite, disc_sprite
+
+# Struct-of-arrays obstacle engine: the same rules as Obstacle.update(),
+# run as array operations so tens of thousands of obstacles stay cheap.
+# Requires NumPy; game16 only imports this module for Game(vectorized=True).
+
+ROCK, BLACKHOLE = 0, 1
+KINDS = {"rock": ROCK, "blackhole": BLACKHOLE}
+
+GRAY = (150, 150, 150)
+BLACK = (0, 0, 0)
+RED = (255, 80, 80)
+
+def swept_hits(ax, ay, aw, ah, adx, ady, bx, by, bw, bh, bdx, bdy):
+    # collision.swept_hit() for one box A against arrays of boxes B
+    lo = np.zeros(np.shape(bx))
+    hi = np.ones(np.shape(bx))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        for a, size_a, b, size_b, v in ((ax, aw, bx, bw, adx - bdx), (ay, ah, by, bh, ady - bdy)):
+            t1 = (b - size_a - a) / v
+            t2 = (b + size_b - a) / v
+            still = v == 0
+            # Not moving on this axis: always or never overlapping on it
+            inside = (a < b + size_b) & (a + size_a > b)
+            t1 = np.where(still, np.where(inside, -np.inf, np.inf), t1)
+            t2 = np.where(still, np.inf, t2)
+            lo = np.maximum(lo, np.minimum(t1, t2))
+            hi = np.minimum(hi, np.maximum(t1, t2))
+    return lo < hi
+
+class ObstacleArray:
+    FIELDS = (("x", np.float64), ("y", np.float64), ("dx", np.float64), ("dy", np.float64),
+              ("size", np.int64), ("kind", np.int8), ("angle", np.float64), ("already_hit", np.bool_),
+              ("px", np.float64), ("py", np.float64))
+
+    def __init__(self, width, height, capacity=256):
+        self.width = width
+        self.height = height
+        self.count = 0
+        for name, dtype in self.FIELDS:
+            setattr(self, "_" + name, np.zeros(capacity, dtype))
+
+    def __len__(self):
+        return self.count
+
+    # Views trimmed to the live obstacles
+    x = property(lambda self: self._x[:self.count])
+    y = property(lambda self: self._y[:self.count])
+    dx = property(lambda self: self._dx[:self.count])
+    dy = property(lambda self: self._dy[:self.count])
+    size = property(lambda self: self._size[:self.count])
+    kind = property(lambda self: self._kind[:self.count])
+    angle = property(lambda self: self._angle[:self.count])
+    already_hit = property(lambda self: self._already_hit[:self.count])
+    px = property(lambda self: self._px[:self.count])
+    py = property(lambda self: self._py[:self.count])
+
+    def _grow(self):
+        capacity = max(16, len(self._x) * 2)
+        for name, _ in self.FIELDS:
+            old = getattr(self, "_" + name)
+            new = np.zeros(capacity, old.dtype)
+            new[:self.count] = old[:self.count]
+            setattr(self, "_" + name, new)
+
+    def append(self, obs):
+        # Copies an Obstacle (or anything with the same fields) into the next slot
+        if self.count == len(self._x):
+            self._grow()
+        i = self.count
+        self._x[i] = obs.x
+        self._y[i] = obs.y
+        self._dx[i] = obs.dx
+        self._dy[i] = obs.dy
+        self._size[i] = obs.size
+        self._kind[i] = KINDS[obs.kind]
+        self._angle[i] = obs.angle
+        self._already_hit[i] = obs.already_hit
+        self._px[i] = obs.x
+        self._py[i] = obs.y
+        self.count += 1
+
+    def clear(self):
+        self.count = 0
+
+    def update(self, rng=random):
+        x, y, dx, dy = self.x, self.y, self.dx, self.dy
+        size, angle = self.size, self.angle
+        # Previous tick's positions, for render interpolation
+        self.px[:] = x
+        self.py[:] = y
+        x += dx
+        y += dy
+        rock = self.kind == ROCK
+        hole = ~rock
+        # Rocks bounce off the walls
+        dx[rock & ((x < 0) | (x > self.width - size))] *= -1
+        dy[rock & ((y < 0) | (y > self.height - size))] *= -1
+        # Black holes wrap from the bottom back to the top at a random x; drawn
+        # in index order so the rng sequence matches the per-object loop
+        for i in np.flatnonzero(hole & (y > self.height)):
+            y[i] = -size[i]
+            x[i] = rng.randint(0, self.width - int(size[i]))
+            self.px[i] = x[i]
+            self.py[i] = y[i]
+        angle[hole] += 5
+
+    def touching(self, rect):
+        # Boxes overlapping rect, using pygame's truncating float->int Rect conversion
+        px, py, pw, ph = rect
+        ox = np.trunc(self.x)
+        oy = np.trunc(self.y)
+        size = self.size
+        return (ox < px + pw) & (ox + size > px) & (oy < py + ph) & (oy + size > py)
+
+    def overlaps(self, rect):
+        return bool(self.touching(rect).any())
+
+    def advance(self, rng, ticks):
+        # Obstacle.advance() for the whole array
+        x0 = self.x.copy()
+        y0 = self.y.copy()
+        hole = self.kind != ROCK
+        for _ in range(ticks):
+            before = self.y.copy()
+            self.update(rng)
+            wrapped = np.flatnonzero(hole & (self.y < before))
+            x0[wrapped] = self.x[wrapped]
+            y0[wrapped] = self.y[wrapped]
+        self.px[:] = x0
+        self.py[:] = y0
+
+    def collide(self, rect, start=None):
+        # One batch test against the UFO rect; marks and returns the indices
+        # of new hits. With start (the UFO box's top-left before the step)
+        # the boxes are also swept from px/py, see collision.swept_hit()
+        hits = self.touching(rect)
+        if start is not None:
+            sx, sy = start
+            px, py, size = self.px, self.py, self.size
+            hits |= swept_hits(sx, sy, rect.w, rect.h, rect.x - sx, rect.y - sy,
+                               px, py, size, size, self.x - px, self.y - py)
+        hits &= ~self.already_hit
+        index = np.flatnonzero(hits)
+        self.already_hit[index] = True
+        return index
+
+    def spent(self):
+        # Same rule as Obstacle.is_spent()
+        rock = self.kind == ROCK
+        return self.already_hit | (rock & (self.y + np.abs(self.dy) + self.size <= 0))
+
+    def recycle_spent(self):
+        dead = self.spent()
+        if not dead.any():
+            return 0
+        keep = np.flatnonzero(~dead)
+        n = len(keep)
+        for name, _ in self.FIELDS:
+            arr = getattr(self, "_" + name)
+            arr[:n] = arr[keep]
+        removed = self.count - n
+        self.count = n
+        return removed
+
+    def draw(self, surface, alpha=1.0):
+        xs, ys = self.x, self.y
+        if alpha < 1:
+            xs = self.px + (xs - self.px) * alpha
+            ys = self.py + (ys - self.py) * alpha
+        blits = []
+        for x, y, size, kind, angle in zip(xs.tolist(), ys.tolist(), self.size.tolist(),
+                                           self.kind.tolist(), self.angle.tolist()):
+            offset = size//2 + SWIRL_PAD
+            pos = (int(x + size/2) - offset, int(y + size/2) - offset)
+            if kind == ROCK:
+                blits.append((disc_sprite(size//2, GRAY), pos))
+            else:
+                blits.append((blackhole_sprite(size, angle, BLACK, RED), pos))
+        return surface.blits(blits)
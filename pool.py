@@ -0,0 +1,45 @@
+# Bounded entity pool: `active` holds live objects, `free` holds recycled
+# ones waiting for reuse. Objects must provide reset(*args), which re-rolls
+# them exactly like a fresh construction, so spawning never allocates once
+# the pool has warmed up.
+class EntityPool:
+    def __init__(self, factory, cap):
+        self.factory = factory
+        self.cap = cap
+        self.active = []
+        self.free = []
+
+    def __len__(self):
+        return len(self.active)
+
+    def __iter__(self):
+        return iter(self.active)
+
+    def spawn(self, *args):
+        if len(self.active) >= self.cap:
+            return None
+        if self.free:
+            obj = self.free.pop()
+            obj.reset(*args)
+        else:
+            obj = self.factory(*args)
+        self.active.append(obj)
+        return obj
+
+    def recycle_if(self, dead, on_recycle=None):
+        # Compact `active` in place so the list object callers hold stays valid
+        active = self.active
+        keep = 0
+        for obj in active:
+            if dead(obj):
+                self.free.append(obj)
+                if on_recycle is not None:
+                    on_recycle(obj)
+            else:
+                active[keep] = obj
+                keep += 1
+        del active[keep:]
+
+    def recycle_all(self):
+        self.free.extend(self.active)
+        self.active.clear()
@@ -0,0 +1,102 @@
+import csv
+import json
+import sys
+import time
+from collections import deque
+
+# Per-phase frame profiler. Phases are timed with start()/stop() pairs
+# (nesting is fine: sub-phases just get their own names), entity counts and
+# allocated-block deltas are sampled once per frame, and the last `window`
+# frames are kept for rolling p50/p95/p99 and for export at exit.
+class FrameProfiler:
+    enabled = True
+
+    def __init__(self, window=600, history=3600):
+        self.window = window
+        self.samples = {}
+        self.frames = deque(maxlen=history)
+        self.current = {}
+        self.frame_index = 0
+        self.frame_start = 0.0
+        self.blocks = 0
+
+    def begin_frame(self):
+        self.current = {}
+        self.blocks = sys.getallocatedblocks()
+        self.frame_start = time.perf_counter()
+
+    def start(self):
+        return time.perf_counter()
+
+    def stop(self, name, started):
+        ms = (time.perf_counter() - started) * 1000
+        # A phase can run several times per frame (e.g. several sim ticks)
+        self.current[name] = self.current.get(name, 0.0) + ms
+
+    def count(self, name, value):
+        self.current[name] = value
+
+    def end_frame(self):
+        self.current["frame"] = (time.perf_counter() - self.frame_start) * 1000
+        self.current["alloc_blocks"] = sys.getallocatedblocks() - self.blocks
+        for name, value in self.current.items():
+            series = self.samples.get(name)
+            if series is None:
+                series = self.samples[name] = deque(maxlen=self.window)
+            series.append(value)
+        self.current["index"] = self.frame_index
+        self.frames.append(self.current)
+        self.frame_index += 1
+
+    def percentiles(self, name):
+        values = sorted(self.samples.get(name, ()))
+        if not values:
+            return 0.0, 0.0, 0.0
+        last = len(values) - 1
+        return tuple(values[min(last, int(p * len(values)))] for p in (0.5, 0.95, 0.99))
+
+    def summary(self):
+        return {name: dict(zip(("p50", "p95", "p99"), self.percentiles(name))) for name in self.samples}
+
+    def dump(self, path):
+        # .csv gets one row per frame; anything else gets JSON with a summary
+        if path.endswith(".csv"):
+            names = sorted({name for frame in self.frames for name in frame} - {"index"})
+            with open(path, "w", newline="") as f:
+                writer = csv.writer(f)
+                writer.writerow(["index"] + names)
+                for frame in self.frames:
+                    writer.writerow([frame["index"]] + [frame.get(name, "") for name in names])
+        else:
+            with open(path, "w") as f:
+                json.dump({"summary": self.summary(), "frames": list(self.frames)}, f, indent=1)
+
+    def draw_overlay(self, surface, font, render_text, color, x=560, y=10):
+        # One line per series: rolling p50 / p95 / p99
+        for name in sorted(self.samples):
+            p50, p95, p99 = self.percentiles(name)
+            text = f"{name}: {p50:.2f} / {p95:.2f} / {p99:.2f}"
+            surface.blit(render_text(font, text, color), (x, y))
+            y += font.get_height()
+
+# Drop-in stand-in when profiling is off: same calls, no work
+class NullProfiler:
+    enabled = False
+
+    def begin_frame(self):
+        pass
+
+    def start(self):
+        return 0.0
+
+    def stop(self, name, started):
+        pass
+
+    def count(self, name, value):
+        pass
+
+    def end_frame(self):
+        pass
+
+    def dump(self, path):
+        pass
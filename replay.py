@@ -0,0 +1,75 @@
+import hashlib
+import json
+import sys
+import time
+
+from game16 import MASK_KEYS, Game
+from rulesets import RULESETS
+
+# Input recording / replay. A recording is the Game seed and options, one key
+# bitmask per sim tick and the discrete actions (riddle answers, hint, try
+# again, restart) with the tick they happened before, plus a digest of the
+# final state. Replays run headless at full speed and must reach that digest.
+
+def state_digest(game):
+    state = (game.tick, game.level_index, game.score, game.player.crashes, game.level_scores,
+             game.game_over, game.awaiting_riddle, game.show_scoreboard, game.show_win,
+             game.player.x, game.player.y,
+             [(o.kind, o.x, o.y, o.dx, o.dy, o.already_hit) for o in game.obstacles],
+             [(s.x, s.y) for s in game.stars])
+    if game.obstacle_array is not None:
+        arr = game.obstacle_array
+        state += (arr.x.tolist(), arr.y.tolist(), arr.dx.tolist(), arr.dy.tolist())
+    return hashlib.sha1(repr(state).encode()).hexdigest()
+
+def make_recording(game):
+    return {
+        "seed": game.seed,
+        "max_obstacles": game.max_obstacles,
+        "vectorized": game.vectorized,
+        "rules": game.ruleset["name"],
+        "keys": bytes(game.recording).hex(),
+        "events": game.recorded_events,
+        "ticks": game.tick,
+        "digest": state_digest(game),
+    }
+
+def save_recording(game, path):
+    with open(path, "w") as f:
+        json.dump(make_recording(game), f)
+
+def load_recording(path):
+    with open(path) as f:
+        return json.load(f)
+
+def replay(recording):
+    game = Game(headless=True, max_obstacles=recording["max_obstacles"],
+                vectorized=recording["vectorized"], seed=recording["seed"],
+                ruleset=RULESETS[recording.get("rules", "game16")])
+    events = sorted(recording["events"], key=lambda e: e[0])
+    pending = 0
+    for tick, mask in enumerate(bytes.fromhex(recording["keys"])):
+        while pending < len(events) and events[pending][0] <= tick:
+            game.perform(events[pending][1], events[pending][2])
+            pending += 1
+        game.update(MASK_KEYS[mask])
+    for _, name, arg in events[pending:]:
+        game.perform(name, arg)
+    return game
+
+def verify(recording):
+    game = replay(recording)
+    return state_digest(game) == recording["digest"], game
+
+# Usage: python replay.py recording.json
+def main():
+    recording = load_recording(sys.argv[1])
+    start = time.perf_counter()
+    ok, game = verify(recording)
+    elapsed = time.perf_counter() - start
+    print(f"{game.tick} ticks replayed in {elapsed:.3f}s ({game.tick / max(elapsed, 1e-9):.0f} ticks/s)")
+    print("final state matches" if ok else "MISMATCH: final state differs from the recording")
+    sys.exit(0 if ok else 1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+# Rulesets for the Cosmic Collector variants. game16.py is the one engine;
+# each variant (game9, game10, game12, game13, game16) is just a table of
+# levels, riddles and the behaviours it switches on:
+#
+#   spawn_chance           1-in-N chance per tick of an extra obstacle (0: never)
+#   extra_rocks_per_level  rocks added per level index on top of the table
+#   intro                  "entry": UFO flies in from entry_start at entry_speed
+#                          "level_name": level name shown for intro_ticks
+#   wrong_answer_crash     a wrong riddle answer also counts as a crash
+#   reset_crashes_per_level  crashes go back to 0 when a level is cleared, so
+#                          the 5-crash game over counts per level, not per run
+#   hint_button            riddle overlay offers a Hint button
+#   hint_after             wrong answers before the hint shows by itself (None: never)
+#   riddle_buttons         Restart / Try Again offered after a wrong answer
+#   win                    "scoreboard": animated scoreboard, then YOU WIN
+#                          "summary": score summary; "celebration": summary
+#                          with a flying UFO and falling stars
+#   background_photo       blend background.png into the level background
+
+CLASSIC_LEVELS = [
+    {"name": "Pink City", "background_color": (255, 182, 193), "stars_needed": 10, "obstacles": 5, "blackholes": 2},
+    {"name": "Blue Space", "background_color": (30, 144, 255), "stars_needed": 12, "obstacles": 8, "blackholes": 3},
+    {"name": "Ocean Block", "background_color": (0, 105, 148), "stars_needed": 15, "obstacles": 12, "blackholes": 4}
+]
+
+CROWDED_LEVELS = [
+    {"name": "Pink City", "background_color": (255, 182, 193), "stars_needed": 10, "obstacles": 15, "blackholes": 8},
+    {"name": "Blue Space", "background_color": (30, 144, 255), "stars_needed": 12, "obstacles": 15, "blackholes": 9},
+    {"name": "Ocean Block", "background_color": (0, 105, 148), "stars_needed": 15, "obstacles": 20, "blackholes": 10}
+]
+
+LEVELS = [
+    {"name": "Pink City", "background_color": (255, 182, 193), "stars_needed": 10, "obstacles": 15, "blackholes": 2},
+    {"name": "Blue Space", "background_color": (30, 144, 255), "stars_needed": 12, "obstacles": 18, "blackholes": 3},
+    {"name": "Ocean Block", "background_color": (0, 105, 148), "stars_needed": 15, "obstacles": 22, "blackholes": 4}
+]
+
+RIDDLES = [
+    {"question": "I speak without a mouth and hear without ears. What am I?", "answer": "echo"},
+    {"question": "I’m tall when I’m young, and short when I’m old. What am I?", "answer": "candle"},
+    {"question": "What has keys but can’t open locks?", "answer": "piano"},
+    {"question": "The more of me you take, the more you leave behind. What am I?", "answer": "footsteps"},
+    {"question": "I have cities but no houses, forests but no trees, and water but no fish. What am I?", "answer": "map"},
+    {"question": "What can run but never walks, has a mouth but never talks?", "answer": "river"},
+    {"question": "I am always hungry and will die if not fed, but whatever I touch will soon turn red. What am I?", "answer": "fire"},
+    {"question": "I can fly without wings, cry without eyes. What am I?", "answer": "cloud"},
+    {"question": "The more you take away from me, the bigger I get. What am I?", "answer": "hole"},
+    {"question": "What has many teeth, but cannot bite?", "answer": "comb"},
+    {"question": "What goes up but never comes down?", "answer": "age"},
+    {"question": "What has a neck but no head?", "answer": "bottle"},
+    {"question": "What can travel around the world while staying in a corner?", "answer": "stamp"},
+    {"question": "What has hands but cannot clap?", "answer": "clock"},
+    {"question": "I’m light as a feather, yet the strongest man cannot hold me for long. What am I?", "answer": "breath"},
+    {"question": "What begins with T, ends with T, and has T in it?", "answer": "teapot"},
+    {"question": "What comes once in a minute, twice in a moment, but never in a thousand years?", "answer": "m"}
+]
+
+GAME16 = {
+    "name": "game16",
+    "levels": LEVELS,
+    "riddles": RIDDLES,
+    "spawn_chance": 120,
+    "extra_rocks_per_level": 0,
+    "intro": "entry",
+    "entry_start": 0,
+    "entry_speed": 10,
+    "wrong_answer_crash": True,
+    "reset_crashes_per_level": False,
+    "hint_button": True,
+    "hint_after": 3,
+    "riddle_buttons": False,
+    "win": "scoreboard",
+    "background_photo": True,
+}
+
+GAME9 = dict(GAME16, name="game9", levels=CLASSIC_LEVELS, riddles=RIDDLES[:9], spawn_chance=0,
+             intro="level_name", intro_ticks=180, wrong_answer_crash=False, reset_crashes_per_level=True,
+             hint_button=False, riddle_buttons=True, win="summary", background_photo=False)
+
+GAME10 = dict(GAME9, name="game10", riddles=RIDDLES[:3], spawn_chance=50, intro="entry", entry_start=-50,
+              entry_speed=8, reset_crashes_per_level=False, win="celebration")
+
+GAME12 = dict(GAME9, name="game12", win="celebration")
+
+GAME13 = dict(GAME9, name="game13", levels=CROWDED_LEVELS, extra_rocks_per_level=2, intro="entry",
+              hint_button=True, hint_after=None, riddle_buttons=False)
+
+RULESETS = {rules["name"]: rules for rules in (GAME9, GAME10, GAME12, GAME13, GAME16)}
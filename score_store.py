@@ -0,0 +1,186 @@
+import os
+import queue
+import sqlite3
+import sys
+import threading
+import time
+import uuid
+from concurrent.futures import Future
+
+# Local high scores and play history in SQLite. A session is one run from
+# the first level to a win, a restart or quitting; it keeps its cleared
+# levels' scores, every crash and every riddle answer given.
+#
+# The game only calls the record_* methods, which put a row on a queue and
+# return at once. One writer thread owns the connection: it waits up to
+# `flush_interval` for more rows and commits all of them as one
+# transaction, so a frame never waits on the disk. Leaderboard queries run
+# on the same thread after the rows queued before them, and come back as a
+# Future the caller polls, like AssetLoader.get().
+#
+#   python score_store.py [scores.db]      prints the leaderboards
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS sessions (
+    id TEXT PRIMARY KEY, ruleset TEXT, seed INTEGER, started REAL, ended REAL,
+    total INTEGER DEFAULT 0, levels INTEGER DEFAULT 0, crashes INTEGER DEFAULT 0, won INTEGER DEFAULT 0);
+CREATE TABLE IF NOT EXISTS levels (
+    session TEXT, ruleset TEXT, level INTEGER, name TEXT, score INTEGER, crashes INTEGER,
+    seconds REAL, at REAL);
+CREATE TABLE IF NOT EXISTS crashes (
+    session TEXT, level INTEGER, tick INTEGER, cause TEXT, at REAL);
+CREATE TABLE IF NOT EXISTS riddle_attempts (
+    session TEXT, level INTEGER, question TEXT, answer TEXT, correct INTEGER, at REAL);
+-- Top-N reads walk these from the best score down and stop after N rows
+CREATE INDEX IF NOT EXISTS sessions_by_total ON sessions (ruleset, total DESC);
+CREATE INDEX IF NOT EXISTS levels_by_score ON levels (ruleset, level, score DESC);
+"""
+
+TOP_SESSIONS = """
+SELECT id, total, levels, crashes, won, started FROM sessions
+WHERE ruleset = ? AND total > 0 ORDER BY total DESC LIMIT ?"""
+
+TOP_LEVEL = """
+SELECT session, score, crashes, seconds, at FROM levels
+WHERE ruleset = ? AND level = ? ORDER BY score DESC LIMIT ?"""
+
+class ScoreStore:
+    def __init__(self, path, flush_interval=0.5):
+        self.path = path
+        self.flush_interval = flush_interval
+        self.queue = queue.SimpleQueue()
+        self.closed = False
+        self.error = None
+        # The schema is made before the first frame, so a bad path fails here
+        conn = self.connect()
+        conn.executescript(SCHEMA)
+        conn.close()
+        self.thread = threading.Thread(target=self.write_loop, name="scores", daemon=True)
+        self.thread.start()
+
+    def connect(self):
+        conn = sqlite3.connect(self.path, check_same_thread=False)
+        # WAL: readers in other processes (score_store.py) do not block commits
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    # Game-side calls: queue and return
+
+    def start_session(self, ruleset, seed):
+        session = uuid.uuid4().hex
+        self.queue.put(("INSERT INTO sessions (id, ruleset, seed, started) VALUES (?, ?, ?, ?)",
+                        (session, ruleset, seed, time.time())))
+        return session
+
+    def record_level(self, session, ruleset, level, name, score, crashes, seconds, total):
+        now = time.time()
+        self.queue.put(("INSERT INTO levels VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                        (session, ruleset, level, name, score, crashes, seconds, now)))
+        # The session's running total, so an unfinished run still ranks
+        self.queue.put(("UPDATE sessions SET total = ?, levels = levels + 1 WHERE id = ?", (total, session)))
+
+    def record_crash(self, session, level, tick, cause):
+        self.queue.put(("INSERT INTO crashes VALUES (?, ?, ?, ?, ?)", (session, level, tick, cause, time.time())))
+        self.queue.put(("UPDATE sessions SET crashes = crashes + 1 WHERE id = ?", (session,)))
+
+    def record_riddle(self, session, level, question, answer, correct):
+        self.queue.put(("INSERT INTO riddle_attempts VALUES (?, ?, ?, ?, ?, ?)",
+                        (session, level, question, answer, int(correct), time.time())))
+
+    def end_session(self, session, won):
+        self.queue.put(("UPDATE sessions SET ended = ?, won = ? WHERE id = ?", (time.time(), int(won), session)))
+
+    def top_sessions(self, ruleset, n=5):
+        # Future of [(id, total, levels, crashes, won, started)], best first
+        return self.query(TOP_SESSIONS, (ruleset, n))
+
+    def top_level(self, ruleset, level, n=5):
+        # Future of [(session, score, crashes, seconds, at)], best first
+        return self.query(TOP_LEVEL, (ruleset, level, n))
+
+    def query(self, sql, params):
+        future = Future()
+        if self.closed:
+            future.set_exception(RuntimeError("score store is closed"))
+        else:
+            self.queue.put((sql, params, future))
+        return future
+
+    def close(self):
+        # Writes everything still queued, then stops the writer
+        if not self.closed:
+            self.closed = True
+            self.queue.put(None)
+            self.thread.join()
+
+    # Writer thread
+
+    def write_loop(self):
+        conn = self.connect()
+        running = True
+        while running:
+            batch = [self.queue.get()]
+            deadline = time.monotonic() + self.flush_interval
+            # Rows wait for company; a query or close() goes out at once
+            while batch[-1] is not None and len(batch[-1]) == 2:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self.queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            if batch[-1] is None:
+                batch.pop()
+                running = False
+            self.write(conn, batch)
+        conn.close()
+
+    def write(self, conn, batch):
+        # Consecutive writes share one transaction; a query commits what
+        # came before it first, so it sees the caller's own rows
+        writes = []
+        for item in batch:
+            if len(item) == 2:
+                writes.append(item)
+                continue
+            self.commit(conn, writes)
+            writes = []
+            sql, params, future = item
+            try:
+                future.set_result(conn.execute(sql, params).fetchall())
+            except sqlite3.Error as e:
+                future.set_exception(e)
+        self.commit(conn, writes)
+
+    def commit(self, conn, writes):
+        if not writes:
+            return
+        try:
+            with conn:
+                for sql, params in writes:
+                    conn.execute(sql, params)
+        except sqlite3.Error as e:
+            # A full disk or a locked file loses this batch, never the game
+            self.error = e
+            print(f"score store: {e}", file=sys.stderr)
+
+def main():
+    path = sys.argv[1] if len(sys.argv) > 1 else os.path.join(os.path.dirname(os.path.abspath(__file__)), "scores.db")
+    if not os.path.exists(path):
+        sys.exit(f"no scores at {path}")
+    conn = sqlite3.connect(path)
+    for (ruleset,) in conn.execute("SELECT DISTINCT ruleset FROM sessions ORDER BY ruleset"):
+        print(f"{ruleset}: best runs")
+        for i, (_, total, levels, crashes, won, started) in enumerate(conn.execute(TOP_SESSIONS, (ruleset, 10))):
+            day = time.strftime("%Y-%m-%d %H:%M", time.localtime(started))
+            print(f"  {i+1:2}. {total:6} Energy  {levels} levels  {crashes} crashes  {'won' if won else '   '}  {day}")
+        for level, name in conn.execute("SELECT DISTINCT level, name FROM levels WHERE ruleset = ? ORDER BY level",
+                                        (ruleset,)):
+            best = [score for _, score, *_ in conn.execute(TOP_LEVEL, (ruleset, level, 3))]
+            print(f"  level {level+1} {name}: best {', '.join(map(str, best))}")
+    conn.close()
+
+if __name__ == "__main__":
+    main()
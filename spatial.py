@@ -0,0 +1,86 @@
+# Uniform-grid spatial hash used as a collision broadphase.
+# Each object is bucketed by the cell of its anchor point (obj.x, obj.y);
+# queries widen the box by `reach`, the furthest any stored box extends
+# from its anchor, so a single bucket per object is enough.
+# Emptied cells are kept until clear(): the keys are bounded by the play
+# area, and re-creating a cell dict each time an object enters an empty
+# cell would allocate every tick.
+class SpatialHash:
+    def __init__(self, cell_size=64):
+        self.cell_size = cell_size
+        self.cells = {}
+        self.keys = {}
+        self.reach = 0
+
+    def __len__(self):
+        return len(self.keys)
+
+    def _bucket(self, obj, key):
+        cell = self.cells.get(key)
+        if cell is None:
+            self.cells[key] = {obj: None}
+        else:
+            cell[obj] = None
+
+    def _unbucket(self, obj, key):
+        del self.cells[key][obj]
+
+    def insert(self, obj, reach=0):
+        if reach > self.reach:
+            self.reach = reach
+        self.move(obj)
+
+    def move(self, obj):
+        cs = self.cell_size
+        key = (obj.x // cs, obj.y // cs)
+        old = self.keys.get(obj)
+        if old == key:
+            return
+        if old is not None:
+            self._unbucket(obj, old)
+        self.keys[obj] = key
+        self._bucket(obj, key)
+
+    def refresh(self, objs):
+        # Re-bucket moved objects in one pass; most frames only compare keys
+        cs = self.cell_size
+        keys = self.keys
+        cells = self.cells
+        for obj in objs:
+            key = (obj.x // cs, obj.y // cs)
+            old = keys.get(obj)
+            if old == key:
+                continue
+            if old is not None:
+                self._unbucket(obj, old)
+            keys[obj] = key
+            cell = cells.get(key)
+            if cell is None:
+                cells[key] = {obj: None}
+            else:
+                cell[obj] = None
+
+    def remove(self, obj):
+        key = self.keys.pop(obj, None)
+        if key is not None:
+            self._unbucket(obj, key)
+
+    def clear(self):
+        self.cells.clear()
+        self.keys.clear()
+        self.reach = 0
+
+    def query(self, x, y, w, h):
+        # Candidates near the box; callers still run the exact overlap test
+        cs = self.cell_size
+        r = self.reach
+        cells = self.cells
+        x0, x1 = int((x - r) // cs), int((x + w + r) // cs)
+        y0, y1 = int((y - r) // cs), int((y + h + r) // cs)
+        found = []
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                cell = cells.get((cx, cy))
+                if cell:
+                    found.extend(cell)
+        return found
@@ -0,0 +1,64 @@
+import pygame
+
+# Sprite-group presenter for the play screen. Each UFO / obstacle / star /
+# HUD line is shown by a DirtySprite in one LayeredDirty group, synced from
+# the game's entity lists every frame. Sprites whose image and position did
+# not change stay clean, so the group only erases and redraws the areas that
+# moved; layers keep obstacles under stars under the UFO under the HUD.
+# Any full-screen frame (overlays, menus, level change) invalidates it.
+OBSTACLE_LAYER, STAR_LAYER, PLAYER_LAYER, HUD_LAYER = range(4)
+
+class EntitySprite(pygame.sprite.DirtySprite):
+    def __init__(self, layer):
+        super().__init__()
+        self._layer = layer
+        self.image = None
+        self.rect = pygame.Rect(0, 0, 0, 0)
+        self.seen = 0
+
+    def show(self, image, pos):
+        pos = (int(pos[0]), int(pos[1]))
+        if image is not self.image or pos != self.rect.topleft:
+            self.image = image
+            self.rect = image.get_rect(topleft=pos)
+            self.dirty = 1
+
+class SpriteRenderer:
+    def __init__(self):
+        self.group = pygame.sprite.LayeredDirty()
+        self.sprites = {}
+        self.background = None
+        self.valid = False
+        self.frame = 0
+
+    def __len__(self):
+        return len(self.sprites)
+
+    def invalidate(self):
+        self.valid = False
+
+    def show(self, key, layer, image, pos):
+        # key is anything stable per entity (pooled objects keep theirs)
+        sprite = self.sprites.get(key)
+        if sprite is None:
+            sprite = self.sprites[key] = EntitySprite(layer)
+            sprite.show(image, pos)
+            self.group.add(sprite)
+        else:
+            sprite.show(image, pos)
+        sprite.seen = self.frame
+
+    def draw(self, surface, background):
+        # Sprites not shown this frame are dropped; the group erases their
+        # last rect. Returns the rects to pass to display.update().
+        stale = [key for key, sprite in self.sprites.items() if sprite.seen != self.frame]
+        for key in stale:
+            self.group.remove(self.sprites.pop(key))
+        self.frame += 1
+        if not self.valid or background is not self.background:
+            self.background = background
+            self.group.clear(surface, background)
+            surface.blit(background, (0, 0))
+            self.group.repaint_rect(surface.get_rect())
+            self.valid = True
+        return self.group.draw(surface)
@@ -0,0 +1,185 @@
+import math
+from collections import OrderedDict
+
+import pygame
+
+# Pre-rendered sprite cache: each shape is drawn once onto its own Surface,
+# keyed by kind, size and colors, so draw() is one blit. Least recently used
+# entries are evicted past max_items; rotating sprites use RotationCache.
+class SpriteCache:
+    def __init__(self, max_items=1024):
+        self.max_items = max_items
+        self.items = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self.items)
+
+    def get(self, key, render, *args):
+        surf = self.items.get(key)
+        if surf is not None:
+            self.items.move_to_end(key)
+            self.hits += 1
+            return surf
+        self.misses += 1
+        surf = self.items[key] = display_format(render(*args))
+        if len(self.items) > self.max_items:
+            self.items.popitem(last=False)
+        return surf
+
+    def clear(self):
+        self.items.clear()
+
+def display_format(surf):
+    # Converted to the display format once a window exists, for fast blits
+    if pygame.display.get_init() and pygame.display.get_surface() is not None:
+        return surf.convert_alpha()
+    return surf
+
+# Rotating sprites keep every quantized angle in one table per sprite key,
+# filled as the angles come up and never evicted: rotation walks the angles
+# in a cycle, the worst case for an LRU, and a level's black holes alone
+# have more (size, angle) keys than SpriteCache holds
+class RotationCache:
+    def __init__(self, angle_step=5):
+        self.angle_step = angle_step
+        self.tables = {}
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return sum(len(table) - table.count(None) for table in self.tables.values())
+
+    def get(self, key, angle, render, *args):
+        # render(angle, *args) draws the sprite at the quantized angle
+        table = self.tables.get(key)
+        if table is None:
+            table = self.tables[key] = [None] * (360 // self.angle_step)
+        i = int(angle % 360 // self.angle_step)
+        surf = table[i]
+        if surf is not None:
+            self.hits += 1
+            return surf
+        self.misses += 1
+        surf = table[i] = display_format(render(i * self.angle_step, *args))
+        return surf
+
+    def clear(self):
+        self.tables.clear()
+
+sprite_cache = SpriteCache()
+rotation_cache = RotationCache()
+# Translucent fills (screen shades, trail segments): few but up to screen
+# sized, so they get their own cache instead of being evicted by rotations
+fill_cache = SpriteCache(max_items=64)
+
+# Renderers: each returns a SRCALPHA surface; callers blit at the offsets noted
+
+# Star polygon, blitted at (x - size, y - size)
+def _render_star(size, color):
+    surf = pygame.Surface((size*2 + 1, size*2 + 1), pygame.SRCALPHA)
+    points = []
+    for i in range(5):
+        angle = i * 72 - 90
+        points.append((size + size * math.cos(math.radians(angle)), size + size * math.sin(math.radians(angle))))
+        angle += 36
+        points.append((size + size//2 * math.cos(math.radians(angle)), size + size//2 * math.sin(math.radians(angle))))
+    pygame.draw.polygon(surf, color, points)
+    return surf
+
+# Filled circle of radius r with an optional swirl line, blitted at (cx - r - 2, cy - r - 2)
+SWIRL_PAD = 2
+
+def _render_disc(radius, color, size=None, angle=None, swirl_color=None):
+    pad = SWIRL_PAD
+    surf = pygame.Surface((radius*2 + 1 + pad*2, radius*2 + 1 + pad*2), pygame.SRCALPHA)
+    center = (radius + pad, radius + pad)
+    pygame.draw.circle(surf, color, center, radius)
+    if swirl_color is not None:
+        end_x = center[0] + int(math.cos(math.radians(angle)) * size//2)
+        end_y = center[1] + int(math.sin(math.radians(angle)) * size//2)
+        pygame.draw.line(surf, swirl_color, center, (end_x, end_y), 3)
+    return surf
+
+# UFO body and dome, blitted at (x - 30, y - 25)
+def _render_ufo(body_color, dome_color):
+    surf = pygame.Surface((60, 40), pygame.SRCALPHA)
+    pygame.draw.ellipse(surf, body_color, (0, 10, 60, 30))
+    pygame.draw.ellipse(surf, dome_color, (15, 0, 30, 20))
+    return surf
+
+# Photo texture cut to a white outline from the renderers above (same size,
+# so callers keep the primitive's blit offsets); angle turns the texture
+def _render_photo(texture, outline, angle=None, swirl=None):
+    surf = pygame.Surface(outline.get_size(), pygame.SRCALPHA)
+    if angle is not None:
+        texture = pygame.transform.rotate(texture, -angle)
+    surf.blit(texture, texture.get_rect(center=surf.get_rect().center))
+    surf.blit(outline, (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
+    if swirl is not None:
+        surf.blit(swirl, (0, 0))
+    return surf
+
+def star_sprite(size, color):
+    return sprite_cache.get(("star", size, color), _render_star, size, color)
+
+def disc_sprite(radius, color):
+    return sprite_cache.get(("disc", radius, color), _render_disc, radius, color)
+
+def _render_blackhole(angle, size, color, swirl_color):
+    return _render_disc(size//2, color, size, angle, swirl_color)
+
+def blackhole_sprite(size, angle, color, swirl_color):
+    key = ("blackhole", size, color, swirl_color)
+    return rotation_cache.get(key, angle, _render_blackhole, size, color, swirl_color)
+
+def ufo_sprite(body_color, dome_color):
+    return sprite_cache.get(("ufo", body_color, dome_color), _render_ufo, body_color, dome_color)
+
+# Rectangle of `size` filled with an RGBA color, blitted at its top-left
+def _render_fill(size, color):
+    surf = pygame.Surface(size, pygame.SRCALPHA)
+    surf.fill(color)
+    return surf
+
+def fill_sprite(size, color):
+    return fill_cache.get(("fill", size, color), _render_fill, size, color)
+
+# The same fill at every alpha 0-255, built together on first use: fades
+# index the list by alpha, so drawing one needs no lookup or new Surface
+_ramps = {}
+
+def alpha_ramp(size, rgb):
+    ramp = _ramps.get((size, rgb))
+    if ramp is None:
+        ramp = _ramps[(size, rgb)] = [display_format(_render_fill(size, rgb + (a,))) for a in range(256)]
+    return ramp
+
+# Textured variants keyed by texture name; the texture is the source image
+# already scaled to the sprite size (see game16.IMAGE_SIZES)
+WHITE = (255, 255, 255)
+
+def _render_photo_star(texture, size):
+    return _render_photo(texture, star_sprite(size, WHITE))
+
+def _render_photo_disc(texture, radius, size=None, angle=None, swirl_color=None):
+    swirl = None
+    if swirl_color is not None:
+        swirl = _render_disc(radius, (0, 0, 0, 0), size, angle, swirl_color)
+    return _render_photo(texture, disc_sprite(radius, WHITE), angle, swirl)
+
+def photo_star_sprite(name, texture, size):
+    key = ("photo_star", name, texture.get_size(), size)
+    return sprite_cache.get(key, _render_photo_star, texture, size)
+
+def photo_disc_sprite(name, texture, radius):
+    key = ("photo_disc", name, texture.get_size(), radius)
+    return sprite_cache.get(key, _render_photo_disc, texture, radius)
+
+def _render_photo_blackhole(angle, texture, size, swirl_color):
+    return _render_photo_disc(texture, size//2, size, angle, swirl_color)
+
+def photo_blackhole_sprite(name, texture, size, angle, swirl_color):
+    key = ("photo_blackhole", name, texture.get_size(), size, swirl_color)
+    return rotation_cache.get(key, angle, _render_photo_blackhole, texture, size, swirl_color)
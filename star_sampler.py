@@ -0,0 +1,86 @@
+import math
+
+# Star placement. Each level gets a table of candidate spots laid out as
+# Poisson-disk (blue) noise: every spot is about `spacing` px or more from every
+# other, generated once per level with Bridson's algorithm from the game's
+# rng and then shuffled. Placing a star walks at most `tries` entries from a
+# random start and takes the first spot the caller's blocked(x, y, w, h)
+# test accepts, so a spawn costs a bounded number of broadphase queries no
+# matter how crowded the level is. If all of those are blocked the walk goes
+# on with the cheaper on_ufo(x, y, w, h) test alone, so a star may land on a
+# hazard but never on the UFO. Exactly one rng draw is made per spawn.
+class StarSampler:
+    def __init__(self, width, height, margin=50, spacing=40, tries=32):
+        self.width = width
+        self.height = height
+        self.margin = margin
+        self.spacing = spacing
+        self.tries = tries
+        self.candidates = []
+
+    def __len__(self):
+        return len(self.candidates)
+
+    def build(self, rng, attempts=12):
+        # Bridson's algorithm: a background grid with cells of spacing/sqrt(2)
+        # holds at most one point each, so a neighbour check looks at 5x5
+        # cells (the grid has a 2-cell border so no bounds checks). New points
+        # are tried just past `spacing` at evenly spaced angles from a random
+        # offset, which packs tighter with fewer attempts than random radii.
+        r = self.spacing
+        r2 = r * r
+        cell = r / math.sqrt(2)
+        w, h = self.width - 2 * self.margin, self.height - 2 * self.margin
+        cols = int(w / cell) + 5
+        grid = [None] * (cols * (int(h / cell) + 5))
+        around = [dy * cols + dx for dy in range(-2, 3) for dx in range(-2, 3)]
+        points = []
+        active = []
+
+        def add(x, y):
+            grid[(int(y / cell) + 2) * cols + int(x / cell) + 2] = (x, y)
+            active.append(len(points))
+            points.append((x, y))
+
+        add(rng.uniform(0, w), rng.uniform(0, h))
+        dist = r * 1.0001
+        step = 2 * math.pi / attempts
+        while active:
+            j = rng.randrange(len(active))
+            px, py = points[active[j]]
+            offset = rng.uniform(0, step)
+            for a in range(attempts):
+                angle = offset + a * step
+                x, y = px + dist * math.cos(angle), py + dist * math.sin(angle)
+                if not (0 <= x <= w and 0 <= y <= h):
+                    continue
+                base = (int(y / cell) + 2) * cols + int(x / cell) + 2
+                for d in around:
+                    q = grid[base + d]
+                    if q is not None and (q[0] - x) ** 2 + (q[1] - y) ** 2 < r2:
+                        break
+                else:
+                    add(x, y)
+                    break
+            else:
+                active[j] = active[-1]
+                active.pop()
+        self.candidates = [(int(self.margin + x), int(self.margin + y)) for x, y in points]
+        rng.shuffle(self.candidates)
+
+    def sample(self, rng, size, blocked, on_ufo=None):
+        # Centre for a star of half-width `size`
+        candidates = self.candidates
+        n = len(candidates)
+        start = rng.randrange(n)
+        for i in range(min(self.tries, n)):
+            x, y = candidates[(start + i) % n]
+            if not blocked(x - size, y - size, size * 2, size * 2):
+                return x, y
+        # A screen packed with hazards: any spot clear of the UFO will do
+        if on_ufo is not None:
+            for i in range(n):
+                x, y = candidates[(start + i) % n]
+                if not on_ufo(x - size, y - size, size * 2, size * 2):
+                    return x, y
+        return candidates[start]
@@ -0,0 +1,181 @@
+import itertools
+import json
+import multiprocessing
+import os
+import random
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+from game16 import HEIGHT, MASK_KEYS, NO_KEYS, SIM_HZ, WIDTH, Game
+from rulesets import RULESETS
+
+# Monte Carlo difficulty sweep. Each parameter set is one level of a ruleset
+# with its stars_needed / obstacles / blackholes possibly overridden; it is
+# played by thousands of headless games (each with its own seed) under a
+# scripted or random pilot, spread over a process pool. For every set it
+# reports how often the level is cleared or lost, the distribution of
+# crashes per minute, the time to clear it and the spread of tick cost.
+#
+#   python sweep.py                                   every level of game16, greedy pilot
+#   python sweep.py --rules game13 --pilot random     another ruleset / pilot
+#   python sweep.py --level 0 --obstacles 5,10,15,20 --blackholes 2,4,8
+#                                                     grid over level 0's numbers
+#   options: --games N (per set, default 1000)  --workers N  --seconds N (time
+#            limit per game, default 120)  --json results.json
+
+GAMES_PER_TASK = 25
+# Tick cost histogram: 0.25 us buckets up to 2 ms, the last one catching the rest
+COST_BUCKETS = 8000
+
+# Pilots: called once per tick with the game and the pilot's own rng,
+# return an arrow-key bitmask (bit 0 left, 1 right, 2 up, 3 down)
+def random_pilot():
+    state = {"mask": 0, "hold": 0}
+    def pilot(game, rng):
+        if state["hold"] <= 0:
+            state["mask"] = rng.randrange(len(MASK_KEYS))
+            state["hold"] = rng.randint(15, 45)
+        state["hold"] -= 1
+        return state["mask"]
+    return pilot
+
+def greedy_pilot():
+    # Heads for the nearest star; an obstacle about to reach the UFO pushes
+    # it away along that axis instead
+    def pilot(game, rng):
+        player = game.player
+        px, py = player.x, player.y
+        star = min(game.stars, key=lambda s: (s.x - px) ** 2 + (s.y - py) ** 2, default=None)
+        tx, ty = (star.x, star.y) if star is not None else (WIDTH // 2, HEIGHT // 2)
+        for obs in game.obstacle_grid.query(px - 60, py - 60, 120, 120):
+            ox = obs.x + obs.size / 2 + obs.dx * 10
+            oy = obs.y + obs.size / 2 + obs.dy * 10
+            if abs(ox - px) < 60 and abs(oy - py) < 60:
+                tx, ty = px + (px - ox) * 4, py + (py - oy) * 4
+                break
+        mask = 0
+        if tx < px - 2:
+            mask |= 1
+        elif tx > px + 2:
+            mask |= 2
+        if ty < py - 2:
+            mask |= 4
+        elif ty > py + 2:
+            mask |= 8
+        return mask
+    return pilot
+
+PILOTS = {"random": random_pilot, "greedy": greedy_pilot}
+
+def play(ruleset, level, pilot, seed, max_ticks, costs):
+    # One attempt at `level`; tick costs are added to the `costs` histogram
+    game = Game(headless=True, seed=seed, ruleset=ruleset)
+    if level:
+        game.level_index = level
+        game.reset_level()
+    while game.show_level_intro:
+        game.update(NO_KEYS)
+    rng = random.Random(seed)
+    clock = time.perf_counter
+    ticks = 0
+    while ticks < max_ticks and not game.awaiting_riddle and not game.game_over:
+        keys = MASK_KEYS[pilot(game, rng)]
+        start = clock()
+        game.update(keys)
+        costs[min(int((clock() - start) * 4e6), COST_BUCKETS - 1)] += 1
+        ticks += 1
+    outcome = "cleared" if game.awaiting_riddle else "lost" if game.game_over else "timeout"
+    return outcome, ticks, game.player.crashes
+
+def run_task(task):
+    index, ruleset, level, pilot_name, seeds, max_ticks = task
+    costs = [0] * COST_BUCKETS
+    games = [play(ruleset, level, PILOTS[pilot_name](), seed, max_ticks, costs) for seed in seeds]
+    return index, games, costs
+
+def percentile(values, p):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(p * len(values)))] if values else float("nan")
+
+def histogram_percentile(counts, p):
+    target = p * sum(counts)
+    seen = 0
+    for bucket, count in enumerate(counts):
+        seen += count
+        if seen >= target and count:
+            return bucket / 4
+    return float("nan")
+
+def summarize(params, games, costs):
+    n = len(games)
+    cleared = [ticks / SIM_HZ for outcome, ticks, _ in games if outcome == "cleared"]
+    rates = [crashes / max(ticks, 1) * SIM_HZ * 60 for _, ticks, crashes in games]
+    return dict(params, games=n,
+                cleared=len(cleared) / n,
+                lost=sum(outcome == "lost" for outcome, _, _ in games) / n,
+                crashes_per_min={f"p{int(p * 100)}": percentile(rates, p) for p in (0.1, 0.5, 0.9)},
+                clear_seconds={f"p{int(p * 100)}": percentile(cleared, p) for p in (0.1, 0.5, 0.9)},
+                tick_us={f"p{int(p * 100)}": histogram_percentile(costs, p) for p in (0.5, 0.95, 0.99)},
+                ticks=sum(costs))
+
+def parameter_sets(ruleset, args):
+    def values(flag):
+        return [int(v) for v in args[args.index(flag) + 1].split(",")] if flag in args else [None]
+    levels = [int(args[args.index("--level") + 1])] if "--level" in args else range(len(ruleset["levels"]))
+    sets = []
+    for level in levels:
+        for stars, obstacles, blackholes in itertools.product(values("--stars"), values("--obstacles"),
+                                                              values("--blackholes")):
+            cfg = dict(ruleset["levels"][level])
+            for key, value in (("stars_needed", stars), ("obstacles", obstacles), ("blackholes", blackholes)):
+                if value is not None:
+                    cfg[key] = value
+            levels_table = list(ruleset["levels"])
+            levels_table[level] = cfg
+            params = {"level": level, "name": cfg["name"], "stars_needed": cfg["stars_needed"],
+                      "obstacles": cfg["obstacles"], "blackholes": cfg["blackholes"]}
+            sets.append((params, dict(ruleset, levels=levels_table), level))
+    return sets
+
+def main():
+    args = sys.argv[1:]
+    option = lambda flag, default: type(default)(args[args.index(flag) + 1]) if flag in args else default
+    ruleset = RULESETS[option("--rules", "game16")]
+    pilot = option("--pilot", "greedy")
+    games = option("--games", 1000)
+    workers = option("--workers", os.cpu_count() or 1)
+    max_ticks = option("--seconds", 120) * SIM_HZ
+    sets = parameter_sets(ruleset, args)
+    tasks = []
+    for index, (params, rules, level) in enumerate(sets):
+        # Every set replays the same seeds, so differences come from the parameters
+        for first in range(0, games, GAMES_PER_TASK):
+            seeds = range(first, min(first + GAMES_PER_TASK, games))
+            tasks.append((index, rules, level, pilot, seeds, max_ticks))
+    results = [([], [0] * COST_BUCKETS) for _ in sets]
+    start = time.perf_counter()
+    print(f"{len(sets)} parameter sets x {games} games, {pilot} pilot, {workers} workers, {ruleset['name']} rules")
+    with multiprocessing.Pool(workers) as pool:
+        for index, played, costs in pool.imap_unordered(run_task, tasks):
+            results[index][0].extend(played)
+            results[index][1][:] = [a + b for a, b in zip(results[index][1], costs)]
+    summaries = [summarize(params, *results[i]) for i, (params, _, _) in enumerate(sets)]
+    print(f"{'level':12} {'stars':>5} {'rocks':>5} {'holes':>5}  {'cleared':>7} {'lost':>5}"
+          f"  crashes/min p10/p50/p90  clear s p10/p50/p90  tick us p50/p95/p99")
+    for s in summaries:
+        c, t, u = s["crashes_per_min"], s["clear_seconds"], s["tick_us"]
+        print(f"{s['level']} {s['name']:10} {s['stars_needed']:5} {s['obstacles']:5} {s['blackholes']:5}"
+              f"  {s['cleared']:7.1%} {s['lost']:5.0%}  {c['p10']:6.1f} {c['p50']:6.1f} {c['p90']:6.1f}"
+              f"       {t['p10']:6.1f} {t['p50']:6.1f} {t['p90']:6.1f}   {u['p50']:5.1f} {u['p95']:5.1f} {u['p99']:6.1f}")
+    elapsed = time.perf_counter() - start
+    ticks = sum(s["ticks"] for s in summaries)
+    print(f"{len(sets) * games} games, {ticks} ticks in {elapsed:.1f}s ({ticks / elapsed:.0f} ticks/s)")
+    if "--json" in args:
+        with open(args[args.index("--json") + 1], "w") as f:
+            json.dump(summaries, f, indent=1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+from collections import OrderedDict
+
+import pygame
+
+# Text render cache: font.render() output keyed by (font, text, color), plus
+# memoized word-wrap layouts, both with LRU eviction. Only strings that
+# actually changed since they were last drawn get re-rendered.
+class TextCache:
+    def __init__(self, max_items=256, max_layouts=64):
+        self.max_items = max_items
+        self.max_layouts = max_layouts
+        self.items = OrderedDict()
+        self.layouts = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def render(self, font, text, color):
+        key = (font, text, color)
+        surf = self.items.get(key)
+        if surf is not None:
+            self.items.move_to_end(key)
+            self.hits += 1
+            return surf
+        self.misses += 1
+        surf = font.render(text, True, color)
+        if pygame.display.get_init() and pygame.display.get_surface() is not None:
+            surf = surf.convert_alpha()
+        self.items[key] = surf
+        if len(self.items) > self.max_items:
+            self.items.popitem(last=False)
+        return surf
+
+    def wrap(self, font, text, max_width):
+        # Same greedy word wrap as draw_wrapped_text, measured once per layout
+        key = (font, text, max_width)
+        lines = self.layouts.get(key)
+        if lines is not None:
+            self.layouts.move_to_end(key)
+            return lines
+        lines = []
+        current_line = ''
+        for word in text.split(' '):
+            test_line = current_line + word + ' '
+            if font.size(test_line)[0] <= max_width:
+                current_line = test_line
+            else:
+                lines.append(current_line)
+                current_line = word + ' '
+        lines.append(current_line)
+        lines = tuple(lines)
+        self.layouts[key] = lines
+        if len(self.layouts) > self.max_layouts:
+            self.layouts.popitem(last=False)
+        return lines
+
+    def clear(self):
+        self.items.clear()
+        self.layouts.clear()
+
+text_cache = TextCache()
+
+def render_text(font, text, color):
+    return text_cache.render(font, text, color)
@@ -0,0 +1,224 @@
+import multiprocessing
+import os
+import random
+
+import numpy as np
+
+from game16 import HEIGHT, MASK_KEYS, NO_KEYS, WIDTH, Game
+
+# Batched environments for automated pilots. N headless Games step in
+# lock-step on Game.update()'s own rules; actions are arrow-key bitmasks
+# (0-15, the same masks replays record) and every step fills preallocated
+# observation / reward / done arrays in place. Riddles are answered
+# correctly on the pilot's behalf and level intros are fast-forwarded, so
+# an episode is play from the first level to a game over or a win.
+#
+#   env = VecEnv(64, seed=1)                  all games in this process
+#   env = ProcessVecEnv(1024, workers=16)     games split over worker processes
+#   obs = env.reset()
+#   obs, rewards, dones = env.step(actions)   games that finish restart at once
+
+NUM_ACTIONS = len(MASK_KEYS)
+NEAREST_OBSTACLES = 8
+NEAREST_STARS = 4
+# Per game: UFO x, y, crashes, level, level progress; then per nearest
+# obstacle (present, dx, dy, vx, vy, size, black hole) and per nearest star
+# (present, dx, dy). Positions are centres relative to the UFO, in screen units.
+OBSTACLE_FEATURES = 7
+STAR_FEATURES = 3
+OBS_SIZE = 5 + NEAREST_OBSTACLES * OBSTACLE_FEATURES + NEAREST_STARS * STAR_FEATURES
+PAD = (0,) * OBS_SIZE
+
+STAR_REWARD = 1.0
+CRASH_REWARD = -1.0
+LEVEL_REWARD = 5.0
+
+def observe(game, out):
+    # Writes the state vector of `game` into the float32 row `out`. Built as
+    # a list and stored in one go: per-element numpy writes cost more than
+    # the game tick itself.
+    player = game.player
+    px, py = player.x, player.y
+    levels = game.levels
+    needed = levels[min(game.level_index, len(levels) - 1)]["stars_needed"] * 10
+    row = [px / WIDTH, py / HEIGHT, player.crashes / 5, game.level_index / len(levels), game.score / needed]
+    if game.obstacle_array is not None:
+        arr = game.obstacle_array
+        size = arr.size
+        dx = arr.x + size / 2 - px
+        dy = arr.y + size / 2 - py
+        near = np.argsort(dx * dx + dy * dy)[:NEAREST_OBSTACLES]
+        for i in near.tolist():
+            row += (1, dx[i] / WIDTH, dy[i] / HEIGHT, arr.dx[i], arr.dy[i], size[i] / 60, arr.kind[i])
+        count = len(near)
+    else:
+        # A level has tens of obstacles: a full sort beats heapq.nsmallest there
+        near = sorted(game.obstacles, key=lambda o: (o.x + o.size / 2 - px) ** 2 + (o.y + o.size / 2 - py) ** 2)
+        del near[NEAREST_OBSTACLES:]
+        for obs in near:
+            half = obs.size / 2
+            row += (1, (obs.x + half - px) / WIDTH, (obs.y + half - py) / HEIGHT, obs.dx, obs.dy,
+                    obs.size / 60, obs.kind != "rock")
+        count = len(near)
+    row += PAD[:(NEAREST_OBSTACLES - count) * OBSTACLE_FEATURES]
+    near = sorted(game.stars, key=lambda s: (s.x - px) ** 2 + (s.y - py) ** 2)
+    del near[NEAREST_STARS:]
+    for star in near:
+        row += (1, (star.x - px) / WIDTH, (star.y - py) / HEIGHT)
+    row += PAD[:(NEAREST_STARS - len(near)) * STAR_FEATURES]
+    out[:] = row
+
+def finished(game):
+    return game.game_over or game.show_scoreboard or game.show_win
+
+def skip_screens(game):
+    # Answers the riddle and runs the level intro, which take no steering
+    if game.awaiting_riddle and not game.game_over:
+        game.perform("answer", game.current_riddle["answer"])
+    while game.show_level_intro and not finished(game):
+        game.update(NO_KEYS)
+
+def advance(game, action, ticks=1):
+    # Runs `ticks` sim ticks holding the keys of `action`; returns (reward, done)
+    keys = MASK_KEYS[action]
+    reward = 0.0
+    for _ in range(ticks):
+        score, crashes, level = game.score, game.player.crashes, game.level_index
+        game.update(keys)
+        reward += (game.score - score) // 10 * STAR_REWARD + (game.player.crashes - crashes) * CRASH_REWARD
+        skip_screens(game)
+        if game.level_index != level or game.show_scoreboard or game.show_win:
+            reward += LEVEL_REWARD
+        if finished(game):
+            return reward, True
+    return reward, False
+
+class VecEnv:
+    def __init__(self, num_envs, seed=None, max_steps=20000, frame_skip=1, ruleset=None, vectorized=False,
+                 obs=None, rewards=None, dones=None):
+        # obs / rewards / dones may be views into shared memory (ProcessVecEnv)
+        self.num_envs = num_envs
+        self.rng = random.Random(seed)
+        self.max_steps = max_steps
+        self.frame_skip = frame_skip
+        self.ruleset = ruleset
+        self.vectorized = vectorized
+        self.obs = obs if obs is not None else np.zeros((num_envs, OBS_SIZE), np.float32)
+        self.rewards = rewards if rewards is not None else np.zeros(num_envs, np.float32)
+        self.dones = dones if dones is not None else np.zeros(num_envs, np.bool_)
+        self.games = [None] * num_envs
+        self.steps = np.zeros(num_envs, np.int64)
+        self.episodes = 0
+
+    def new_game(self, i):
+        game = Game(headless=True, seed=self.rng.randrange(2**32), ruleset=self.ruleset,
+                    vectorized=self.vectorized)
+        skip_screens(game)
+        self.games[i] = game
+        self.steps[i] = 0
+        observe(game, self.obs[i])
+
+    def reset(self):
+        for i in range(self.num_envs):
+            self.new_game(i)
+        return self.obs
+
+    def step(self, actions):
+        obs, rewards, dones, steps = self.obs, self.rewards, self.dones, self.steps
+        frame_skip, max_steps = self.frame_skip, self.max_steps
+        for i, game in enumerate(self.games):
+            reward, done = advance(game, actions[i], frame_skip)
+            steps[i] += 1
+            rewards[i] = reward
+            dones[i] = done or steps[i] >= max_steps
+            if dones[i]:
+                # Auto-reset: the row holds the first observation of the next episode
+                self.episodes += 1
+                self.new_game(i)
+            else:
+                observe(game, obs[i])
+        return obs, rewards, dones
+
+    def close(self):
+        pass
+
+def worker(conn, buffers, start, count, seed, max_steps, frame_skip, ruleset, vectorized):
+    # Runs games [start, start + count) on views into the parent's arrays
+    actions, obs, rewards, dones = (a[start:start + count] for a in shared_arrays(buffers))
+    env = VecEnv(count, seed, max_steps, frame_skip, ruleset, vectorized, obs, rewards, dones)
+    while True:
+        command = conn.recv()
+        if command == "step":
+            env.step(actions)
+            conn.send(True)
+        elif command == "reset":
+            env.reset()
+            conn.send(True)
+        elif command == "episodes":
+            conn.send(env.episodes)
+        else:
+            break
+
+# (name, ctypes code, numpy dtype, per-game shape) of the shared arrays
+SHARED = (("actions", "q", np.int64, ()), ("obs", "f", np.float32, (OBS_SIZE,)),
+          ("rewards", "f", np.float32, ()), ("dones", "b", np.bool_, ()))
+
+def shared_arrays(buffers):
+    return [np.frombuffer(buf, dtype).reshape((-1,) + shape) for buf, (_, _, dtype, shape) in zip(buffers, SHARED)]
+
+class ProcessVecEnv:
+    # Same interface as VecEnv, with the games split over worker processes.
+    # Actions go in and observations / rewards / dones come back through
+    # shared-memory arrays; the pipes only carry one short command per step.
+    def __init__(self, num_envs, workers=None, seed=None, max_steps=20000, frame_skip=1, ruleset=None,
+                 vectorized=False):
+        workers = min(workers or os.cpu_count() or 1, num_envs)
+        self.num_envs = num_envs
+        # Fork keeps start-up cheap where it exists
+        ctx = multiprocessing.get_context("fork" if "fork" in multiprocessing.get_all_start_methods() else "spawn")
+        buffers = [ctx.RawArray(code, num_envs * int(np.prod(shape))) for _, code, _, shape in SHARED]
+        self.actions, self.obs, self.rewards, self.dones = shared_arrays(buffers)
+        # Each worker gets its own seed stream
+        seeds = random.Random(seed)
+        self.conns = []
+        self.procs = []
+        for w in range(workers):
+            start = num_envs * w // workers
+            count = num_envs * (w + 1) // workers - start
+            parent, child = ctx.Pipe()
+            proc = ctx.Process(target=worker, daemon=True,
+                               args=(child, buffers, start, count, seeds.randrange(2**32),
+                                     max_steps, frame_skip, ruleset, vectorized))
+            proc.start()
+            child.close()
+            self.conns.append(parent)
+            self.procs.append(proc)
+
+    def call(self, command):
+        for conn in self.conns:
+            conn.send(command)
+        return [conn.recv() for conn in self.conns]
+
+    def reset(self):
+        self.call("reset")
+        return self.obs
+
+    def step(self, actions):
+        self.actions[:] = actions
+        self.call("step")
+        return self.obs, self.rewards, self.dones
+
+    @property
+    def episodes(self):
+        return sum(self.call("episodes"))
+
+    def close(self):
+        for conn in self.conns:
+            try:
+                conn.send("close")
+            except OSError:
+                pass
+        for proc in self.procs:
+            proc.join(timeout=5)
+        self.conns = []
+        self.procs = []